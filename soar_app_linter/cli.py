@@ -63,6 +63,13 @@ def parse_args(args: List[str] = None) -> argparse.Namespace:
         help="Skip dependency installation and ignore import errors",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run pylint instead of reusing the output of an identical previous run, "
+        "e.g. after changing code the app imports from editable installs or PYTHONPATH",
+    )
+
     parser.add_argument(
         "--disable-app-json-validation",
         action="store_true",
@@ -166,6 +173,7 @@ def process_single_repo(
         verbose=args.verbose,
         message_level=args.message_level,
         no_deps=args.no_deps,
+        use_cache=not args.no_cache,
     )
 
     # Extract error codes and messages from output
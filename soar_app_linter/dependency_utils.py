@@ -1,24 +1,75 @@
+import functools
+import hashlib
+import json
 import logging
+import os
 from pathlib import Path
 
+try:
+    import tomllib as _toml
+except ImportError:  # Python < 3.11
+    import tomli as _toml
+
 
 logger = logging.getLogger(__name__)
 
 # Constants
 EGG_FRAGMENT = "#egg="
+VENV_STATE_FILE = ".soar-linter-state.json"
 
 # Tracks deps that were not installable in the last run (best-effort info)
 LAST_UNINSTALLED_DEPS: list[str] = []
 
 
+@functools.lru_cache(maxsize=256)
+def _compute_empty(path_str: str, mtime_ns: int, size: int) -> bool:
+    """Check if a file only contains comments/whitespace.
+
+    mtime_ns and size are part of the cache key so an edited file is re-read.
+    """
+    if size == 0:
+        return True
+
+    # Scan raw bytes; the first non-comment, non-blank line settles it
+    with open(path_str, "rb") as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped and not stripped.startswith(b"#"):
+                return False
+    return True
+
+
+def _debug_output_kwargs() -> dict:
+    """Return subprocess.run output arguments for commands whose output is only logged at DEBUG.
+
+    Without DEBUG logging stdout is discarded instead of being buffered and decoded only
+    to be thrown away. stderr is always captured so failures can still be diagnosed.
+    """
+    import subprocess
+
+    if logger.isEnabledFor(logging.DEBUG):
+        return {"stdout": subprocess.PIPE, "stderr": subprocess.PIPE, "text": True}
+    return {"stdout": subprocess.DEVNULL, "stderr": subprocess.PIPE, "text": True}
+
+
+def _uv_install_cmd(venv_python: Path, *args: str) -> list[str]:
+    """Build a `uv pip install` command run through the venv's python.
+
+    uv's -v flag is only passed when DEBUG logging keeps its output.
+    """
+    verbosity = ["-v"] if logger.isEnabledFor(logging.DEBUG) else []
+    return [str(venv_python), "-m", "uv", "pip", "install", *verbosity, *args]
+
+
 def _is_empty_or_irrelevant(file_path: Path) -> bool:
     """Check if a requirements.txt file is empty or doesn't contain any dependencies."""
-    if not file_path.exists():
+    # A single stat doubles as the existence check; missing files count as empty
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
         return True
 
-    # Check if file is empty or only contains comments/whitespace
-    with open(file_path) as f:
-        return not any(line.strip() and not line.strip().startswith("#") for line in f)
+    return _compute_empty(str(file_path), stat_result.st_mtime_ns, stat_result.st_size)
 
 
 def _ensure_venv_exists(directory: Path) -> tuple[Path, Path]:
@@ -36,29 +87,27 @@ def _ensure_venv_exists(directory: Path) -> tuple[Path, Path]:
                 [sys.executable, "-m", "venv", str(venv_dir)],
                 cwd=directory,
                 check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+                **_debug_output_kwargs(),
             )
             logger.debug(
-                f"[install_dependencies] venv creation stdout: {result.stdout}"
+                "[install_dependencies] venv creation stdout: %s", result.stdout
             )
             logger.debug(
-                f"[install_dependencies] venv creation stderr: {result.stderr}"
+                "[install_dependencies] venv creation stderr: %s", result.stderr
             )
         except Exception as e:
             logger.error(f"Failed to create virtual environment: {e}")
             raise
     else:
         logger.debug(
-            f"[install_dependencies] Virtual environment already exists at {venv_dir}"
+            "[install_dependencies] Virtual environment already exists at %s", venv_dir
         )
 
     return venv_dir, venv_python
 
 
-def _ensure_uv_installed(venv_python: Path, directory: Path) -> None:
-    """Ensure uv is installed in the virtual environment."""
+def _is_uv_installed(venv_python: Path) -> bool:
+    """Check whether uv is installed in the virtual environment."""
     import subprocess
 
     try:
@@ -66,20 +115,29 @@ def _ensure_uv_installed(venv_python: Path, directory: Path) -> None:
         subprocess.run(
             [str(venv_python), "-m", "uv", "--version"],
             check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         logger.debug("[install_dependencies] 'uv' is installed in venv.")
+        return True
     except (subprocess.SubprocessError, FileNotFoundError):
+        return False
+
+
+def _ensure_uv_installed(
+    venv_python: Path, directory: Path, uv_installed: bool
+) -> None:
+    """Ensure uv is installed in the virtual environment."""
+    import subprocess
+
+    if not uv_installed:
         logger.info("'uv' not found in venv, installing it...")
         try:
             subprocess.run(
                 [str(venv_python), "-m", "pip", "install", "uv"],
                 cwd=directory,
                 check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+                **_debug_output_kwargs(),
             )
             logger.info("'uv' installed in venv.")
         except Exception as e:
@@ -87,28 +145,110 @@ def _ensure_uv_installed(venv_python: Path, directory: Path) -> None:
             raise
 
 
-def _install_pylint(venv_python: Path, directory: Path) -> None:
+@functools.lru_cache(maxsize=16)
+def _load_toml(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Parse a TOML file.
+
+    mtime_ns and size are part of the cache key so an edited file is re-parsed.
+    """
+    with open(path_str, "rb") as f:
+        return _toml.load(f)
+
+
+def _read_project_version(pyproject: Path) -> str | None:
+    """Return the [project] version declared in a pyproject.toml, if any."""
+    try:
+        stat_result = pyproject.stat()
+        data = _load_toml(str(pyproject), stat_result.st_mtime_ns, stat_result.st_size)
+    except (OSError, ValueError):
+        return None
+
+    version = data.get("project", {}).get("version")
+    return version if isinstance(version, str) else None
+
+
+def _get_installed_version(venv_python: Path, distribution: str) -> str | None:
+    """Return the version of a distribution installed in the venv, or None if it is missing."""
+    import subprocess
+
+    result = subprocess.run(
+        [
+            str(venv_python),
+            "-c",
+            "import importlib.metadata, sys; print(importlib.metadata.version(sys.argv[1]))",
+            distribution,
+        ],
+        check=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def _versions_match(installed: str, expected: str) -> bool:
+    """Compare two version strings, normalizing them when possible (e.g. 1.0.0-beta.1 == 1.0.0b1)."""
+    from packaging.version import InvalidVersion, Version
+
+    try:
+        return Version(installed) == Version(expected)
+    except InvalidVersion:
+        return installed == expected
+
+
+def _probe_venv(venv_python: Path) -> tuple[bool, str | None, str | None]:
+    """Run the read-only venv probes concurrently.
+
+    Each probe is a separate interpreter startup with no dependency on the others,
+    so running them in parallel costs roughly as much as the slowest one.
+
+    Returns:
+        tuple: (uv installed, installed pylint version, installed soar-app-linter version)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        uv_future = executor.submit(_is_uv_installed, venv_python)
+        pylint_future = executor.submit(_get_installed_version, venv_python, "pylint")
+        linter_future = executor.submit(
+            _get_installed_version, venv_python, "soar-app-linter"
+        )
+        return uv_future.result(), pylint_future.result(), linter_future.result()
+
+
+def _install_pylint(
+    venv_python: Path, directory: Path, installed_version: str | None
+) -> None:
     """Install pylint in the virtual environment."""
     import subprocess
 
+    if installed_version:
+        logger.debug(
+            "[install_dependencies] pylint %s already installed in venv; skipping install.",
+            installed_version,
+        )
+        return
+
     try:
         result = subprocess.run(
             [str(venv_python), "-m", "pip", "install", "pylint"],
             cwd=directory,
             check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+            **_debug_output_kwargs(),
         )
-        logger.debug(f"[install_dependencies] pylint install stdout: {result.stdout}")
-        logger.debug(f"[install_dependencies] pylint install stderr: {result.stderr}")
+        logger.debug("[install_dependencies] pylint install stdout: %s", result.stdout)
+        logger.debug("[install_dependencies] pylint install stderr: %s", result.stderr)
         logger.info("[install_dependencies] pylint installed in venv.")
     except Exception as e:
         logger.error(f"[install_dependencies] Failed to install pylint in venv: {e}")
         raise
 
 
-def _install_soar_linter(venv_python: Path, directory: Path, venv_dir: Path) -> None:
+def _install_soar_linter(
+    venv_python: Path, directory: Path, venv_dir: Path, installed_version: str | None
+) -> None:
     """Install soar-app-linter package in the virtual environment."""
     import subprocess
 
@@ -127,6 +267,18 @@ def _install_soar_linter(venv_python: Path, directory: Path, venv_dir: Path) ->
         )
         return
 
+    local_version = _read_project_version(linter_src / "pyproject.toml")
+    if (
+        installed_version
+        and local_version
+        and _versions_match(installed_version, local_version)
+    ):
+        logger.debug(
+            "[install_dependencies] soar-app-linter %s already installed in venv; skipping install.",
+            installed_version,
+        )
+        return
+
     logger.info(
         f"[install_dependencies] Installing soar-app-linter from {linter_src} into venv at {venv_dir}"
     )
@@ -135,15 +287,13 @@ def _install_soar_linter(venv_python: Path, directory: Path, venv_dir: Path) ->
             [str(venv_python), "-m", "pip", "install", "-e", str(linter_src)],
             cwd=directory,
             check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+            **_debug_output_kwargs(),
         )
         logger.debug(
-            f"[install_dependencies] soar-app-linter install stdout: {result.stdout}"
+            "[install_dependencies] soar-app-linter install stdout: %s", result.stdout
         )
         logger.debug(
-            f"[install_dependencies] soar-app-linter install stderr: {result.stderr}"
+            "[install_dependencies] soar-app-linter install stderr: %s", result.stderr
         )
         logger.info("[install_dependencies] soar-app-linter installed in venv.")
 
@@ -160,12 +310,11 @@ def _install_soar_linter(venv_python: Path, directory: Path, venv_dir: Path) ->
                 ],
                 cwd=directory,
                 check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+                **_debug_output_kwargs(),
             )
             logger.debug(
-                f"[install_dependencies] Plugin verification stdout: {verify_result.stdout.strip()}"
+                "[install_dependencies] Plugin verification stdout: %s",
+                (verify_result.stdout or "").strip(),
             )
             logger.info("[install_dependencies] Custom plugins are importable in venv.")
         except Exception as plugin_e:
@@ -182,42 +331,72 @@ def _install_soar_linter(venv_python: Path, directory: Path, venv_dir: Path) ->
 
 
 def _update_pylintrc(directory: Path) -> None:
-    """Update .pylintrc to ignore .venv directory."""
+    """Update .pylintrc to ignore .venv directory.
+
+    Only the ignore option of the main section is edited in place, the rest of the
+    file (comments and line endings included) is kept as written.
+    """
+    import re
+
     pylintrc = directory / ".pylintrc"
+    venv_entry = ".venv"
+    section_re = re.compile(r"^\[([^\]]+)\]")
+    ignore_re = re.compile(r"^ignore\s*[=:]")
+    # pylint still accepts the legacy [MASTER] name for its [MAIN] section
+    main_sections = ("MAIN", "MASTER")
     try:
-        ignore_line = "ignore="
-        venv_entry = ".venv"
-        if pylintrc.exists():
-            with open(pylintrc, "r+") as f:
-                lines = f.readlines()
-            found = False
-            for i, line in enumerate(lines):
-                if line.strip().startswith(ignore_line):
-                    found = True
-                    ignores = [
-                        x.strip()
-                        for x in line[len(ignore_line) :].split(",")
-                        if x.strip()
-                    ]
-                    if venv_entry not in ignores:
-                        ignores.append(venv_entry)
-                        lines[i] = ignore_line + ", ".join(ignores) + "\n"
-                        logger.debug(
-                            "[install_dependencies] Added .venv to ignore in .pylintrc"
-                        )
-            if not found:
-                lines.append(f"{ignore_line}{venv_entry}\n")
+        if not pylintrc.exists():
+            pylintrc.write_text(f"[MASTER]\nignore = {venv_entry}\n\n")
+            logger.debug("[install_dependencies] Created .pylintrc with ignore=.venv")
+            return
+
+        with open(pylintrc, newline="") as f:
+            lines = f.readlines()
+
+        section = None
+        main_header = None  # index of the first main section header
+        ignore_lines: list[int] = []  # the ignore option and its continuation lines
+        for i, line in enumerate(lines):
+            if ignore_lines:
+                # indented lines continue the value
+                if line[:1] in (" ", "\t") and line.strip():
+                    ignore_lines.append(i)
+                    continue
+                break
+            match = section_re.match(line)
+            if match:
+                section = match.group(1).strip()
+                if section in main_sections and main_header is None:
+                    main_header = i
+            elif section in main_sections and ignore_re.match(line):
+                ignore_lines.append(i)
+
+        newline = "\r\n" if lines and lines[0].endswith("\r\n") else "\n"
+        if ignore_lines:
+            value = "".join(lines[i] for i in ignore_lines)
+            value = value[ignore_re.match(value).end() :]
+            if venv_entry in (x.strip() for x in value.split(",")):
                 logger.debug(
-                    "[install_dependencies] Created ignore entry in .pylintrc for .venv"
+                    "[install_dependencies] .venv already ignored in .pylintrc"
                 )
-            with open(pylintrc, "w") as f:
-                f.writelines(lines)
+                return
+            # append to the last line of the value
+            last = ignore_lines[-1]
+            separator = ", " if value.strip() else " "
+            lines[last] = f"{lines[last].rstrip()}{separator}{venv_entry}{newline}"
+        elif main_header is not None:
+            lines[main_header] = lines[main_header].rstrip("\r\n") + newline
+            lines.insert(main_header + 1, f"ignore = {venv_entry}{newline}")
         else:
-            with open(pylintrc, "w") as f:
-                f.write(f"[MASTER]\n{ignore_line}{venv_entry}\n")
-                logger.debug(
-                    "[install_dependencies] Created .pylintrc with ignore=.venv"
-                )
+            # no main section yet, add one after the existing content
+            if lines:
+                lines[-1] = lines[-1].rstrip("\r\n") + newline
+                lines.append(newline)
+            lines.append(f"[MASTER]{newline}ignore = {venv_entry}{newline}")
+
+        with open(pylintrc, "w", newline="") as f:
+            f.writelines(lines)
+        logger.debug("[install_dependencies] Added .venv to ignore in .pylintrc")
     except Exception as e:
         logger.warning(f"[install_dependencies] Could not update .pylintrc: {e}")
 
@@ -230,71 +409,60 @@ def _get_dependency_files(directory: Path, venv_python: Path) -> list:
     requirements_dir = directory / "requirements"
 
     # Check for requirements.txt and requirements-dev.txt
-    if req_txt.exists() and not _is_empty_or_irrelevant(req_txt):
+    if not _is_empty_or_irrelevant(req_txt):
         dependency_files.append(
             (
                 req_txt,
-                [
-                    str(venv_python),
-                    "-m",
-                    "uv",
-                    "pip",
-                    "install",
-                    "-v",
-                    "-r",
-                    "requirements.txt",
-                ],
+                _uv_install_cmd(venv_python, "-r", "requirements.txt"),
             )
         )
-    if req_dev_txt.exists() and not _is_empty_or_irrelevant(req_dev_txt):
+    if not _is_empty_or_irrelevant(req_dev_txt):
         dependency_files.append(
             (
                 req_dev_txt,
-                [
-                    str(venv_python),
-                    "-m",
-                    "uv",
-                    "pip",
-                    "install",
-                    "-v",
-                    "-r",
-                    "requirements-dev.txt",
-                ],
+                _uv_install_cmd(venv_python, "-r", "requirements-dev.txt"),
             )
         )
 
     # Add requirements/*.txt files
     logger.debug(
-        f"[install_dependencies] Checking for requirements directory at {requirements_dir}"
+        "[install_dependencies] Checking for requirements directory at %s",
+        requirements_dir,
     )
-    if requirements_dir.is_dir():
-        logger.debug("[install_dependencies] requirements directory exists.")
-        for req_file in requirements_dir.glob("*.txt"):
-            logger.debug(f"[install_dependencies] Found requirements file: {req_file}")
-            if not _is_empty_or_irrelevant(req_file):
+    # Stat each entry once via scandir and reuse it for the emptiness check
+    try:
+        with os.scandir(requirements_dir) as entries:
+            logger.debug("[install_dependencies] requirements directory exists.")
+            for entry in entries:
+                if not entry.name.endswith(".txt") or not entry.is_file():
+                    continue
                 logger.debug(
-                    f"[install_dependencies] {req_file} is not empty or irrelevant. Adding to dependency_files."
+                    "[install_dependencies] Found requirements file: %s", entry.path
+                )
+                stat_result = entry.stat()
+                if _compute_empty(
+                    entry.path, stat_result.st_mtime_ns, stat_result.st_size
+                ):
+                    logger.debug(
+                        "[install_dependencies] %s is empty or irrelevant. Skipping.",
+                        entry.path,
+                    )
+                    continue
+                logger.debug(
+                    "[install_dependencies] %s is not empty or irrelevant. Adding to dependency_files.",
+                    entry.path,
                 )
                 dependency_files.append(
                     (
-                        req_file,
-                        [
-                            str(venv_python),
-                            "-m",
-                            "uv",
-                            "pip",
-                            "install",
-                            "-v",
+                        Path(entry.path),
+                        _uv_install_cmd(
+                            venv_python,
                             "-r",
-                            str(req_file.relative_to(directory)),
-                        ],
+                            os.path.join(requirements_dir.name, entry.name),
+                        ),
                     )
                 )
-            else:
-                logger.debug(
-                    f"[install_dependencies] {req_file} is empty or irrelevant. Skipping."
-                )
-    else:
+    except (FileNotFoundError, NotADirectoryError):
         logger.debug("[install_dependencies] requirements directory does not exist.")
 
     return dependency_files
@@ -388,7 +556,7 @@ def _verify_installed_dependencies(
             text=True,
         )
         logger.debug(
-            f"[install_dependencies] Installed packages:\n{list_result.stdout}"
+            "[install_dependencies] Installed packages:\n%s", list_result.stdout
         )
 
         # Check which dependencies are missing
@@ -419,7 +587,7 @@ def _is_installation_error_ignorable(stderr: str, dep_file: Path) -> bool:
     ]
 
     if any(msg in (stderr or "") for msg in ignorable_messages):
-        logger.debug(f"No dependencies to install from {dep_file.name}")
+        logger.debug("No dependencies to install from %s", dep_file.name)
         return True
     return False
 
@@ -444,7 +612,7 @@ def _install_and_verify_dependencies(
         f"Retrieving dependencies for {dep_file.name} (using venv at {venv_dir})..."
     )
     logger.debug(
-        f"[install_dependencies] Running command: {' '.join(cmd)} in {directory}"
+        "[install_dependencies] Running command: %s in %s", " ".join(cmd), directory
     )
 
     try:
@@ -462,18 +630,13 @@ def _install_and_verify_dependencies(
                     find_links_args.extend(["--find-links", str(candidate)])
 
         primary_cmd = (
-            [
-                str(venv_python),
-                "-m",
-                "uv",
-                "pip",
-                "install",
-                "-v",
+            _uv_install_cmd(
+                venv_python,
                 "-r",
                 str(dep_file.relative_to(directory)),
                 "--only-binary=:all:",
                 *find_links_args,
-            ]
+            )
             if find_links_args
             else cmd
         )
@@ -482,21 +645,24 @@ def _install_and_verify_dependencies(
             primary_cmd,
             cwd=directory,
             check=False,  # Don't raise exception on non-zero exit
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+            **_debug_output_kwargs(),
         )
 
-        logger.debug(f"[install_dependencies] Command stdout: {result.stdout}")
-        logger.debug(f"[install_dependencies] Command stderr: {result.stderr}")
-        logger.debug(f"[install_dependencies] Command return code: {result.returncode}")
+        logger.debug("[install_dependencies] Command stdout: %s", result.stdout)
+        logger.debug("[install_dependencies] Command stderr: %s", result.stderr)
+        logger.debug(
+            "[install_dependencies] Command return code: %s", result.returncode
+        )
 
-        # Even if the batch resolver succeeded, continue to verify per-package presence
-        if result.returncode == 0:
+        LAST_UNINSTALLED_DEPS.clear()
+        if result.returncode == 0 and find_links_args:
+            # The wheel-only batch installed every requirement, re-resolving each package
+            # individually would only repeat that work one uv process at a time. A plain
+            # batch may have built sdists, so the loop below still checks for wheels
             logger.info("Dependencies installed successfully in venv (batch)")
+            return True
 
         # Per-package wheel-only installs to avoid one bad dep blocking all
-        LAST_UNINSTALLED_DEPS.clear()
         for dep in dependencies:
             # Extract clean package name for wheel installation
             package_name = _extract_package_name(dep)
@@ -506,45 +672,26 @@ def _install_and_verify_dependencies(
             # Try local wheels
             ok = False
             if find_links_args:
-                cmd_local = [
-                    str(venv_python),
-                    "-m",
-                    "uv",
-                    "pip",
-                    "install",
-                    "-v",
-                    "--only-binary=:all:",
-                    *find_links_args,
-                    package_name,
-                ]
+                cmd_local = _uv_install_cmd(
+                    venv_python, "--only-binary=:all:", *find_links_args, package_name
+                )
                 r = subprocess.run(
                     cmd_local,
                     cwd=directory,
                     check=False,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
+                    **_debug_output_kwargs(),
                 )
                 ok = r.returncode == 0
             if not ok:
                 # Try index wheels only
-                cmd_index = [
-                    str(venv_python),
-                    "-m",
-                    "uv",
-                    "pip",
-                    "install",
-                    "-v",
-                    "--only-binary=:all:",
-                    package_name,
-                ]
+                cmd_index = _uv_install_cmd(
+                    venv_python, "--only-binary=:all:", package_name
+                )
                 r2 = subprocess.run(
                     cmd_index,
                     cwd=directory,
                     check=False,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
+                    **_debug_output_kwargs(),
                 )
                 ok = r2.returncode == 0
             if not ok:
@@ -558,11 +705,62 @@ def _install_and_verify_dependencies(
         return True
 
     except Exception as e:
-        # Non-fatal: proceed with linting even if dependency resolution fails
+        # Non-fatal: linting proceeds even if dependency resolution fails
         logger.warning(
             f"Proceeding without installing dependencies from {dep_file.name}: {e}"
         )
-        return True
+        return False
+
+
+def _compute_dependency_state(directory: Path) -> str:
+    """Hash the inputs that determine what install_dependencies puts into the venv."""
+    import importlib.metadata
+
+    linter_src = Path(__file__).parent.parent.resolve()
+    candidates = [
+        linter_src / "pyproject.toml",
+        directory / "requirements.txt",
+        directory / "requirements-dev.txt",
+    ]
+    requirements_dir = directory / "requirements"
+    if requirements_dir.is_dir():
+        candidates.extend(sorted(requirements_dir.glob("*.txt")))
+
+    try:
+        linter_version = importlib.metadata.version("soar-app-linter")
+    except importlib.metadata.PackageNotFoundError:
+        linter_version = ""
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{linter_src}\0{linter_version}\0".encode())
+    for candidate in candidates:
+        digest.update(f"{candidate}\0".encode())
+        try:
+            digest.update(candidate.read_bytes())
+        except OSError:
+            digest.update(b"<missing>")
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _read_venv_state(venv_dir: Path) -> str | None:
+    """Return the dependency state hash recorded by the last successful install, if any."""
+    try:
+        state = json.loads((venv_dir / VENV_STATE_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+    return state.get("inputs_hash") if isinstance(state, dict) else None
+
+
+def _write_venv_state(venv_dir: Path, inputs_hash: str) -> None:
+    """Atomically record the dependency state hash of a successful install."""
+    state_file = venv_dir / VENV_STATE_FILE
+    tmp_file = state_file.with_name(f"{state_file.name}.tmp")
+    try:
+        tmp_file.write_text(json.dumps({"inputs_hash": inputs_hash}))
+        os.replace(tmp_file, state_file)
+    except OSError as e:
+        logger.warning(f"[install_dependencies] Could not write {state_file}: {e}")
 
 
 def install_dependencies(directory: str) -> bool:
@@ -572,33 +770,49 @@ def install_dependencies(directory: str) -> bool:
     # Convert to Path object and resolve to absolute path
     directory = Path(directory).resolve()
 
+    # The .pylintrc isn't part of the dependency state, so check it on every run
+    _update_pylintrc(directory)
+
+    # Skip everything when the venv was set up from the same inputs by a previous run
+    inputs_hash = _compute_dependency_state(directory)
+    venv_dir = directory / ".venv"
+    venv_ready = (venv_dir / "bin" / "python").exists()
+    if venv_ready and _read_venv_state(venv_dir) == inputs_hash:
+        logger.info(
+            "Dependencies unchanged since the last successful install, skipping dependency installation"
+        )
+        LAST_UNINSTALLED_DEPS.clear()
+        return True
+
     try:
         # Set up virtual environment and tools
         venv_dir, venv_python = _ensure_venv_exists(directory)
-        _ensure_uv_installed(venv_python, directory)
-        _install_pylint(venv_python, directory)
-        _install_soar_linter(venv_python, directory, venv_dir)
-        _update_pylintrc(directory)
+        uv_installed, pylint_version, linter_version = _probe_venv(venv_python)
+        _ensure_uv_installed(venv_python, directory, uv_installed)
+        _install_pylint(venv_python, directory, pylint_version)
+        _install_soar_linter(venv_python, directory, venv_dir, linter_version)
 
         # Install project dependencies
         dependency_files = _get_dependency_files(directory, venv_python)
 
-        # Try each dependency file in order
-        for dep_file, cmd in dependency_files:
-            logger.debug(f"[install_dependencies] Checking dependency file: {dep_file}")
-            if dep_file.exists() and not _is_empty_or_irrelevant(dep_file):
-                return _install_and_verify_dependencies(
-                    dep_file, cmd, venv_python, directory, venv_dir
-                )
-            else:
-                logger.debug(
-                    f"[install_dependencies] {dep_file} does not exist or is empty/irrelevant. Skipping."
-                )
+        # Install from the first dependency file found; _get_dependency_files only
+        # returns files that exist and are not empty/irrelevant
+        if dependency_files:
+            dep_file, cmd = dependency_files[0]
+            logger.debug("[install_dependencies] Using dependency file: %s", dep_file)
+            installed = _install_and_verify_dependencies(
+                dep_file, cmd, venv_python, directory, venv_dir
+            )
+        else:
+            logger.debug(
+                "No supported non-empty dependency files found, skipping dependency installation"
+            )
+            installed = True
 
-        logger.debug(
-            "No supported non-empty dependency files found, skipping dependency installation"
-        )
-        return True
+        # Only remember fully successful installs so failures are retried next run
+        if installed and not LAST_UNINSTALLED_DEPS:
+            _write_venv_state(venv_dir, inputs_hash)
+        return installed
 
     except Exception as e:
         logger.error(f"Failed to install dependencies: {e}")
@@ -1,40 +1,40 @@
 """Pylint custom rules plugin package."""
 
+import importlib
+
+# Checker modules registered by this plugin, each exposing a register(linter) function.
+# Every checker has to be registered up front since pylint loads plugins before parsing
+# --enable/--disable and needs the message definitions to resolve them; checkers with no
+# enabled messages are not walked. avoid_deprecation_base is not listed since it only
+# provides alias tracking to its subclasses and has no messages of its own.
+_CHECKERS = (
+    "avoid_313_random_deprecations_on_all",
+    "avoid_313_removals_on_39",
+    "avoid_chained_classmethod_on_313",
+    "avoid_global_playbook_apis",
+    "avoid_global_variables",
+    "avoid_filesystem_access",
+    "avoid_infinite_loops",
+    "avoid_libraries",
+    "avoid_lxml_library",
+    "avoid_shell_access",
+    "avoid_sleeping",
+)
+
+
+# Set on the linter once the checkers are registered. Parallel (-j) workers unpickle the
+# linter with its checkers and then force-load the plugins again, which would otherwise
+# register every checker twice and report each message twice.
+REGISTERED_ATTR = "_soar_checkers_registered"
+
 
 def register(linter):
-    """Register all checkers with the linter.
-
-    This function avoids circular imports by importing the checkers only when needed.
-    """
-    # Import checkers here to avoid circular imports
-    from . import (
-        avoid_313_random_deprecations_on_all as random_deprecations,
-        avoid_313_removals_on_39 as removals,
-        avoid_chained_classmethod_on_313 as chained_classmethod,
-        avoid_deprecation_base as base,
-        avoid_global_playbook_apis as global_apis,
-        avoid_global_variables as global_variables,
-        avoid_filesystem_access as filesystem_access,
-        avoid_infinite_loops as infinite_loops,
-        avoid_libraries as libraries,
-        avoid_lxml_library as lxml_library,
-        avoid_shell_access as shell_access,
-        avoid_sleeping as sleeping,
-    )
-
-    # Register each checker
-    random_deprecations.register(linter)
-    removals.register(linter)
-    chained_classmethod.register(linter)
-    base.register(linter)
-    global_apis.register(linter)
-    global_variables.register(linter)
-    filesystem_access.register(linter)
-    infinite_loops.register(linter)
-    libraries.register(linter)
-    lxml_library.register(linter)
-    shell_access.register(linter)
-    sleeping.register(linter)
+    """Register all checkers with the linter."""
+    if getattr(linter, REGISTERED_ATTR, False):
+        return
+    setattr(linter, REGISTERED_ATTR, True)
+    for module_name in _CHECKERS:
+        importlib.import_module(f".{module_name}", __package__).register(linter)
 
 
 # This makes the package a valid PyLint plugin
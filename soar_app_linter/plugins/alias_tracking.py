@@ -0,0 +1,25 @@
+from astroid import nodes
+from pylint.checkers import BaseChecker  # noqa: PH107 avoid pylint imports
+
+
+class AliasTrackingChecker(BaseChecker):
+    """Base for checkers that track the names a few specific modules are imported as."""
+
+    # module name -> handler called with the name bound by "import <module> [as <alias>]"
+    IMPORT_HANDLERS: dict = {}
+    # module name -> handler called with the node of "from <module> import ..."
+    IMPORTFROM_HANDLERS: dict = {}
+
+    # implementing the pylint checker method that visits all import nodes
+    def visit_import(self, node: nodes.Import) -> None:
+        handlers = self.IMPORT_HANDLERS
+        for module_name, alias in node.names:
+            handler = handlers.get(module_name)
+            if handler:
+                handler(self, alias or module_name)
+
+    # implementing the pylint checker method that visits all importfrom nodes
+    def visit_importfrom(self, node: nodes.ImportFrom) -> None:
+        handler = self.IMPORTFROM_HANDLERS.get(node.modname)
+        if handler:
+            handler(self, node)
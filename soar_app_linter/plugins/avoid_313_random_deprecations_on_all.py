@@ -24,15 +24,28 @@ class Avoid313RandomDeprecationsOnAll(AvoidDeprecationBase):
     }
 
     def visit_call(self, node: nodes.Call) -> None:
+        # cheap pre-filter on the called name before resolving the full module path
+        func = node.func
+        if isinstance(func, nodes.Attribute):
+            if func.attrname not in self._HANDLERS:
+                return
+        elif isinstance(func, nodes.Name):
+            # names may be aliases (e.g. from random import sample as smp)
+            resolved_name = self.alias_map.get(func.name, func.name)
+            if resolved_name.rpartition(".")[2] not in self._HANDLERS:
+                return
+
         module_name = self._resolve_full_name(node)
         if module_name.startswith("random."):
-            method_name = module_name.split(".")[-1]
-            if method_name == "sample":
-                self.add_message("consider-random-sample-sequence", node=node)
-            elif method_name == "randrange":
-                self.add_message("consider-random-randrange-integer-args", node=node)
-            elif method_name == "shuffle":
-                self._check_random_shuffle(node)
+            handler = self._HANDLERS.get(module_name.rpartition(".")[2])
+            if handler:
+                handler(self, node)
+
+    def _check_random_sample(self, node: nodes.Call):
+        self.add_message("consider-random-sample-sequence", node=node)
+
+    def _check_random_randrange(self, node: nodes.Call):
+        self.add_message("consider-random-randrange-integer-args", node=node)
 
     def _check_random_shuffle(self, node: nodes.Call):
         # Check for the second positional argument
@@ -43,6 +56,13 @@ class Avoid313RandomDeprecationsOnAll(AvoidDeprecationBase):
         if any(kw.arg == "random" for kw in node.keywords):
             self.add_message("no-random-shuffle-random-param", node=node)
 
+    # random method name -> check, also used to pre-filter calls in visit_call
+    _HANDLERS = {
+        "sample": _check_random_sample,
+        "randrange": _check_random_randrange,
+        "shuffle": _check_random_shuffle,
+    }
+
 
 def register(linter):
     linter.register_checker(Avoid313RandomDeprecationsOnAll(linter))
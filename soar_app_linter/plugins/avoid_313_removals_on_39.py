@@ -1,18 +1,24 @@
 import sys
 from astroid import nodes
-from pylint.lint import PyLinter  # avoid pylint imports
-from .avoid_deprecation_base import AvoidDeprecationBase
-
-REMOVED_MODULES: set[str] = {
-    "distutils",
-    "formatter",
-    "parser",
-    "binhex",
-    "imp",
-    "asynchat",
-    "asyncore",
-    "mailcap",
-}
+from .avoid_deprecation_base import AvoidDeprecationBase, register_for_interpreter
+
+REMOVED_MODULES: frozenset[str] = frozenset(
+    {
+        "distutils",
+        "formatter",
+        "parser",
+        "binhex",
+        "imp",
+        "asynchat",
+        "asyncore",
+        "mailcap",
+    }
+)
+
+# dotted removed modules split into (package, module), checked against from-imports
+REMOVED_SUBMODULE_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    tuple(module.rsplit(".", 1)) for module in REMOVED_MODULES if "." in module
+)
 
 REMOVED_CLASSES: dict[str, set[str]] = {
     "pkgutil": {"ImpLoader", "ImpImporter"},
@@ -41,6 +47,22 @@ REMOVED_DECORATORS: dict[str, set[str]] = {
 }
 
 
+def _index_by_name(removed: dict[str, set[str]]) -> dict[str, tuple[str, ...]]:
+    """Invert a module -> names mapping into name -> modules, keeping the module order."""
+    index: dict[str, tuple[str, ...]] = {}
+    for module, names in removed.items():
+        for name in names:
+            index[name] = (*index.get(name, ()), module)
+    return index
+
+
+# looked up by the last part of the resolved name so most nodes cost a single dict miss
+REMOVED_METHODS_BY_NAME = _index_by_name(REMOVED_METHODS)
+REMOVED_ATTRIBUTES_BY_NAME = _index_by_name(REMOVED_ATTRIBUTES)
+REMOVED_CLASSES_BY_NAME = _index_by_name(REMOVED_CLASSES)
+REMOVED_DECORATORS_BY_NAME = _index_by_name(REMOVED_DECORATORS)
+
+
 class Avoid313RemovalsOn39(AvoidDeprecationBase):
     name = "no-313-removals-on-39"
     priority = -1
@@ -72,14 +94,7 @@ class Avoid313RemovalsOn39(AvoidDeprecationBase):
         ),
     }
 
-    def __init__(self, linter: PyLinter) -> None:
-        super().__init__(linter)
-        self.enabled = sys.version_info[:2] == (3, 9)
-
     def visit_import(self, node: nodes.Import) -> None:
-        if not self.enabled:
-            return
-
         super().visit_import(node)
 
         for name, _ in node.names:
@@ -87,9 +102,6 @@ class Avoid313RemovalsOn39(AvoidDeprecationBase):
                 self.add_message("no-313-removed-module", node=node, args=(name,))
 
     def visit_importfrom(self, node: nodes.ImportFrom) -> None:
-        if not self.enabled:
-            return
-
         super().visit_importfrom(node)
 
         module_name = node.modname
@@ -97,10 +109,10 @@ class Avoid313RemovalsOn39(AvoidDeprecationBase):
             self.add_message("no-313-removed-module", node=node, args=(module_name,))
 
         for name, _ in node.names:
-            full_name = f"{module_name}.{name}"
-
-            if full_name in REMOVED_MODULES:
-                self.add_message("no-313-removed-module", node=node, args=(full_name,))
+            if (module_name, name) in REMOVED_SUBMODULE_PAIRS:
+                self.add_message(
+                    "no-313-removed-module", node=node, args=(f"{module_name}.{name}",)
+                )
 
             if (
                 module_name in REMOVED_ATTRIBUTES
@@ -121,70 +133,61 @@ class Avoid313RemovalsOn39(AvoidDeprecationBase):
                 )
 
     def visit_call(self, node: nodes.Call) -> None:
-        if not self.enabled:
-            return
-
-        self._check_method(node)
-        self._check_class(node)
+        # both checks look at the same resolved name, resolve the callee directly
+        module_name = self._resolve_full_name(node.func)
+        self._check_method(node, module_name)
+        self._check_class(node, module_name)
 
     def visit_attribute(self, node: nodes.Attribute) -> None:
-        if not self.enabled:
-            return
-
         self._check_attribute(node)
 
     def visit_classdef(self, node: nodes.ClassDef) -> None:
-        if not self.enabled:
-            return
-
         if node.bases:
             for base_node in node.bases:
-                self._check_class(base_node)
+                self._check_class(base_node, self._resolve_full_name(base_node))
 
     def visit_functiondef(self, node: nodes.FunctionDef) -> None:
-        if not self.enabled:
-            return
-
         if node.decorators:
             for decorator_node in node.decorators.nodes:
                 self._check_decorator(decorator_node)
 
-    def _check_method(self, node) -> None:
-        module_name = self._resolve_full_name(node)
-        method_name = module_name.split(".")[-1]
-        for library, methods in REMOVED_METHODS.items():
-            if module_name.startswith(library) and method_name in methods:
+    def _check_method(self, node, module_name: str) -> None:
+        method_name = module_name.rpartition(".")[2]
+        for library in REMOVED_METHODS_BY_NAME.get(method_name, ()):
+            if module_name.startswith(library):
                 self.add_message(
                     "no-313-removed-method", node=node, args=(method_name, library)
                 )
 
     def _check_attribute(self, node) -> None:
         module_name = self._resolve_full_name(node)
-        attr_name = module_name.split(".")[-1]
-        for module, attributes in REMOVED_ATTRIBUTES.items():
-            if module_name.startswith(module) and attr_name in attributes:
+        attr_name = module_name.rpartition(".")[2]
+        for module in REMOVED_ATTRIBUTES_BY_NAME.get(attr_name, ()):
+            if module_name.startswith(module):
                 self.add_message(
                     "no-313-removed-attribute", node=node, args=(attr_name, module)
                 )
 
-    def _check_class(self, node) -> None:
-        module_name = self._resolve_full_name(node)
-        class_name = module_name.split(".")[-1]
-        for module, classes in REMOVED_CLASSES.items():
-            if module_name.startswith(module) and class_name in classes:
+    def _check_class(self, node, module_name: str) -> None:
+        class_name = module_name.rpartition(".")[2]
+        for module in REMOVED_CLASSES_BY_NAME.get(class_name, ()):
+            if module_name.startswith(module):
                 self.add_message(
                     "no-313-removed-class", node=node, args=(class_name, module)
                 )
 
     def _check_decorator(self, node) -> None:
         module_name = self._resolve_full_name(node)
-        decorator_name = module_name.split(".")[-1]
-        for module, decorators in REMOVED_DECORATORS.items():
-            if module_name.startswith(module) and decorator_name in decorators:
+        decorator_name = module_name.rpartition(".")[2]
+        for module in REMOVED_DECORATORS_BY_NAME.get(decorator_name, ()):
+            if module_name.startswith(module):
                 self.add_message(
                     "no-313-removed-decorator", node=node, args=(decorator_name, module)
                 )
 
 
 def register(linter):
-    linter.register_checker(Avoid313RemovalsOn39(linter))
+    # Only needed on 3.9, pylint doesn't walk it on other versions
+    register_for_interpreter(
+        linter, Avoid313RemovalsOn39, sys.version_info[:2] == (3, 9)
+    )
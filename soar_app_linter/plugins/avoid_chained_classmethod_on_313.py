@@ -1,11 +1,13 @@
 import sys
+from typing import Optional
 from astroid import nodes
-from pylint.lint import PyLinter  # avoid pylint imports
-from .avoid_deprecation_base import AvoidDeprecationBase
+from .avoid_deprecation_base import AvoidDeprecationBase, register_for_interpreter
 
 
 # List of common descriptor names to check
-DESCRIPTOR_NAMES = {"property", "staticmethod", "cached_property", "abstractmethod"}
+DESCRIPTOR_NAMES = frozenset(
+    {"property", "staticmethod", "cached_property", "abstractmethod"}
+)
 
 
 class AvoidChainedClassmethodOn313(AvoidDeprecationBase):
@@ -20,31 +22,36 @@ class AvoidChainedClassmethodOn313(AvoidDeprecationBase):
         ),
     }
 
-    def __init__(self, linter: PyLinter) -> None:
-        super().__init__(linter)
-        # Only run on 3.13 and greater - the __wrapped__ alternative doesn't exist until 3.10
-        self.enabled = sys.version_info[:2] >= (3, 13)
+    @staticmethod
+    def _decorator_name(decorator_node) -> Optional[str]:
+        """Return the name of a bare-name decorator (e.g. @classmethod), otherwise None."""
+        if isinstance(decorator_node, nodes.Name):
+            return decorator_node.name
+        return None
 
     def _check_decorator(self, attribute) -> None:
         if isinstance(attribute, nodes.FunctionDef) and attribute.decorators:
             decorator_nodes = attribute.decorators.nodes
             if len(decorator_nodes) > 1 and any(
-                d.as_string() == "classmethod" for d in decorator_nodes
+                self._decorator_name(d) == "classmethod" for d in decorator_nodes
             ):
                 for decorator_node in decorator_nodes:
-                    if decorator_node.as_string() in DESCRIPTOR_NAMES:
+                    decorator_name = self._decorator_name(decorator_node)
+                    if decorator_name in DESCRIPTOR_NAMES:
                         self.add_message(
                             "no-chained-classmethod",
                             node=decorator_node,
-                            args=(decorator_node.as_string(),),
+                            args=(decorator_name,),
                         )
 
     def visit_classdef(self, node: nodes.ClassDef) -> None:
         """Visit class definitions to find chained classmethod descriptors."""
-        if self.enabled:
-            for attribute in node.body:
-                self._check_decorator(attribute)
+        for attribute in node.body:
+            self._check_decorator(attribute)
 
 
 def register(linter):
-    linter.register_checker(AvoidChainedClassmethodOn313(linter))
+    # Only run on 3.13 and greater - the __wrapped__ alternative doesn't exist until 3.10
+    register_for_interpreter(
+        linter, AvoidChainedClassmethodOn313, sys.version_info[:2] >= (3, 13)
+    )
@@ -1,60 +1,143 @@
+from typing import Optional
+
 from astroid import nodes
 from pylint.checkers import BaseChecker  # avoid pylint imports
 from pylint.lint import PyLinter  # avoid pylint imports
 
+# linter attribute holding the AliasTracker shared by the checkers of the current run
+SHARED_TRACKER_ATTR = "_soar_alias_tracker"
+
+
+class AliasTracker:
+    """Alias map built once per module and shared by the deprecation checkers."""
+
+    def __init__(self, owner: "AvoidDeprecationBase") -> None:
+        # the checker that maintains the map, the others only read it
+        self.owner = owner
+        self.alias_map: dict[str, str] = {}
+        # resolved names keyed by node id, only valid while the alias map is unchanged
+        self.name_cache: dict[int, str] = {}
 
-class AvoidDeprecationBase(BaseChecker):
-    __implements__ = BaseChecker
 
+class AvoidDeprecationBase(BaseChecker):
     def __init__(self, linter: PyLinter) -> None:
         super().__init__(linter)
-        # the aliases are sets because in python its valid to import a library more than once
-        self.alias_map: dict[str, str] = {}
-        self.enabled = True
+        self._aliases = AliasTracker(self)
+
+    @property
+    def alias_map(self) -> dict[str, str]:
+        return self._aliases.alias_map
+
+    def open(self) -> None:
+        # Every enabled checker would build the same alias map, so the first one opened
+        # maintains a single map on the linter and the others read it
+        tracker: Optional[AliasTracker] = getattr(
+            self.linter, SHARED_TRACKER_ATTR, None
+        )
+        if tracker is None:
+            tracker = AliasTracker(self)
+            setattr(self.linter, SHARED_TRACKER_ATTR, tracker)
+        self._aliases = tracker
+
+    def close(self) -> None:
+        if getattr(self.linter, SHARED_TRACKER_ATTR, None) is self._aliases:
+            setattr(self.linter, SHARED_TRACKER_ATTR, None)
+
+    def _is_tracking_aliases(self) -> bool:
+        return self._aliases.owner is self
+
+    def leave_module(self, node: nodes.Module) -> None:
+        # aliases are per module, and node ids can be reused once a module's tree is freed
+        if self._is_tracking_aliases():
+            self._aliases.alias_map.clear()
+            self._aliases.name_cache.clear()
+
+    def _set_alias(self, name: str, value: str) -> None:
+        if self.alias_map.get(name) != value:
+            self.alias_map[name] = value
+            self._aliases.name_cache.clear()
 
     def visit_import(self, node: nodes.Import) -> None:
-        if not self.enabled:
+        if not self._is_tracking_aliases():
             return
 
         # build alias map
         for name, alias in node.names:
-            self.alias_map[alias or name] = name
+            self._set_alias(alias or name, name)
 
     def visit_importfrom(self, node: nodes.ImportFrom) -> None:
-        if not self.enabled:
+        if not self._is_tracking_aliases():
             return
 
         # build alias map
         module_name = node.modname
         for name, alias in node.names:
             full_name = f"{module_name}.{name}"
-            self.alias_map[alias or name] = full_name
+            self._set_alias(alias or name, full_name)
 
     def visit_assign(self, node: nodes.Assign) -> None:
+        if not self._is_tracking_aliases():
+            return
+
         for target_node in node.targets:
             node_value = self._resolve_full_name(node.value)
 
             if isinstance(target_node, nodes.AssignName):
-                self.alias_map[target_node.name] = (
-                    node_value if node_value else target_node.name
+                self._set_alias(
+                    target_node.name, node_value if node_value else target_node.name
                 )
             elif isinstance(target_node, nodes.AssignAttr):
-                self.alias_map[target_node.as_string()] = node_value
+                self._set_alias(target_node.as_string(), node_value)
 
     def _resolve_full_name(self, node) -> str:
         """Resolve the full module path for a node."""
-        if isinstance(node, nodes.Name):
-            return self.alias_map.get(node.name, node.name)
-        elif isinstance(node, nodes.Attribute):
-            # Recursively resolve the full name for chained attributes
-            base_name = self._resolve_full_name(node.expr)
+        name_cache = self._aliases.name_cache
+        key = id(node)
+        full_name = name_cache.get(key)
+        if full_name is None:
+            full_name = name_cache[key] = self._compute_full_name(node)
+        return full_name
+
+    def _compute_full_name(self, node) -> str:
+        resolver = self._RESOLVERS.get(type(node))
+        return resolver(self, node) if resolver else ""
+
+    def _resolve_name(self, node: nodes.Name) -> str:
+        return self.alias_map.get(node.name, node.name)
+
+    def _resolve_attribute(self, node: nodes.Attribute) -> str:
+        # Recursively resolve the full name for chained attributes
+        base_name = self._resolve_full_name(node.expr)
+
+        return f"{base_name}.{node.attrname}" if base_name else node.attrname
+
+    def _resolve_call(self, node: nodes.Call) -> str:
+        # Handle the case where the node is a call to a class to create an instance
+        return self._resolve_full_name(node.func)
+
+    # node type -> resolver, a single dict lookup instead of an isinstance chain
+    _RESOLVERS = {
+        nodes.Name: _resolve_name,
+        nodes.Attribute: _resolve_attribute,
+        nodes.Call: _resolve_call,
+    }
+
 
-            return f"{base_name}.{node.attrname}" if base_name else node.attrname
-        elif isinstance(node, nodes.Call):
-            # Handle the case where the node is a call to a class to create an instance
-            return self._resolve_full_name(node.func)
-        return ""
+def register_for_interpreter(
+    linter: PyLinter, checker_class: type, supported: bool
+) -> None:
+    """Register a version-specific checker, or only its messages on other interpreters.
 
+    The app pylintrc enables these messages on every interpreter, so pylint has to know
+    their ids everywhere, but a checker that can't report anything isn't worth walking.
+    """
+    if supported:
+        linter.register_checker(checker_class(linter))
+        return
 
-def register(linter):
-    linter.register_checker(AvoidDeprecationBase(linter))
+    messages_only = type(
+        checker_class.__name__,
+        (BaseChecker,),
+        {"name": checker_class.name, "msgs": checker_class.msgs},
+    )
+    linter.register_checker(messages_only(linter))
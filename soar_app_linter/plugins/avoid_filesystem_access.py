@@ -1,12 +1,7 @@
-from pylint.checkers import BaseChecker  # noqa: PH107 avoid pylint imports
-
-
 from .banned_functions import BannedFunctions
 
 
 class AvoidFilesystemAccess(BannedFunctions):
-    __implements__ = BaseChecker
-
     name = "avoid-filesystem-access"
 
     BANNED_FUNCTIONS_MAP = {
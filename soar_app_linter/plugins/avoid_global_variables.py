@@ -1,14 +1,15 @@
 import astroid
-from astroid import nodes
+from astroid import Context, nodes
 from pylint.checkers import BaseChecker  # noqa: PH107 avoid pylint imports
 
 from pylint.lint import PyLinter  # noqa: PH107 avoid pylint imports
 
+from .module_level import ModuleLevelMixin
 
-class AvoidGlobalVars(BaseChecker):
+
+class AvoidGlobalVars(ModuleLevelMixin, BaseChecker):
     """Checker to avoid global variables updates in non-module scope."""
 
-    __implements__ = BaseChecker
     priority = -1
 
     name = "no-globals"
@@ -20,66 +21,73 @@ class AvoidGlobalVars(BaseChecker):
         ),
     }
     MUTABLE_TYPES = (astroid.List, astroid.Dict, astroid.Set)
-    MUTATE_METHODS = {
-        "append",
-        "extend",
-        "insert",
-        "remove",
-        "pop",
-        "clear",
-        "sort",
-        "reverse",
-        "add",
-        "discard",
-        "update",
-        "intersection_update",
-        "difference_update",
-        "symmetric_difference_update",
-        "__setitem__",
-        "setdefault",
-        "popitem",
-    }
+    # astroid doesn't subclass these, so a type lookup matches the same nodes as isinstance
+    _MUTABLE_TYPE_SET = frozenset(MUTABLE_TYPES)
+    MUTATE_METHODS = frozenset(
+        {
+            "append",
+            "extend",
+            "insert",
+            "remove",
+            "pop",
+            "clear",
+            "sort",
+            "reverse",
+            "add",
+            "discard",
+            "update",
+            "intersection_update",
+            "difference_update",
+            "symmetric_difference_update",
+            "__setitem__",
+            "setdefault",
+            "popitem",
+        }
+    )
 
     def __init__(self, linter: PyLinter) -> None:
         self.mutable_globals: set[str] = set()
         self.current_globals: set[str] = set()
+        # enclosing if/while statements with a non-static condition
+        self.nonstatic_branches: list[nodes.NodeNG] = []
         super().__init__(linter)
 
-    def _is_module_level(self, node: nodes.NodeNG) -> bool:
-        """Traverse up the tree to determine if the node is at module level"""
-        parent = node.parent
-        if isinstance(parent, astroid.scoped_nodes.Module):
-            return True
-        elif isinstance(
-            parent, (astroid.scoped_nodes.ClassDef, astroid.scoped_nodes.FunctionDef)
-        ):
-            return False
-        # Otherwise, follow parent(parent could be an if condition, for loop,..etc)
-        return self._is_module_level(parent)
+    def leave_module(self, node: nodes.Module) -> None:
+        # globals are per module, the next one starts with none
+        self.mutable_globals.clear()
+        self.current_globals = set()
+        self.nonstatic_branches.clear()
 
     def _is_nonstatic_condition(self, condition_node: nodes.NodeNG) -> bool:
-        """Traverse up the tree to determine if the condition contains function call"""
+        """Traverse the condition to determine if it contains function call"""
         if not condition_node:
             return False
 
-        if isinstance(condition_node, astroid.Call):
-            return True
-
-        for operand in condition_node.get_children():
-            if self._is_nonstatic_condition(operand):
+        # walk the condition subtree with an explicit stack instead of recursing
+        pending = [condition_node]
+        while pending:
+            operand = pending.pop()
+            if isinstance(operand, astroid.Call):
                 return True
+            pending.extend(operand.get_children())
 
         return False
 
     def _is_within_non_static_condition_if_while(self, node: nodes.NodeNG) -> bool:
-        """Traverse up the tree to determine if the node is within if or while statement with non-static condition"""
-        current = node
-        while current:
-            if isinstance(current, (astroid.If, astroid.While)):
-                if self._is_nonstatic_condition(current.test):
-                    return True
-            current = current.parent
-        return False
+        """Determine if the node is within if or while statement with non-static condition"""
+        return bool(self.nonstatic_branches)
+
+    def visit_if(self, node: nodes.If) -> None:
+        """Track if statements with non-static conditions, including their test"""
+        if self._is_nonstatic_condition(node.test):
+            self.nonstatic_branches.append(node)
+
+    def leave_if(self, node: nodes.If) -> None:
+        if self.nonstatic_branches and self.nonstatic_branches[-1] is node:
+            self.nonstatic_branches.pop()
+
+    visit_while = visit_if
+    leave_while = leave_if
 
     def _check_valid_update(self, node: nodes.NodeNG, node_name: str) -> None:
         if self._is_module_level(node):
@@ -92,16 +100,18 @@ class AvoidGlobalVars(BaseChecker):
     def visit_assign(self, node: nodes.Assign) -> None:
         """Check for reassignments of globals once created"""
         if self._is_module_level(node):
-            for target in node.targets:
-                if isinstance(target, astroid.AssignName):
-                    if self._is_within_non_static_condition_if_while(target):
+            # Every target shares the statement's scope and enclosing conditions
+            if self._is_within_non_static_condition_if_while(node):
+                for target in node.targets:
+                    if isinstance(target, astroid.AssignName):
                         # To prevent unpredictable update at module level
                         self.add_message(
                             "no-global-updates", node=node, args=target.name
                         )
-                    else:
-                        if isinstance(node.value, self.MUTABLE_TYPES):
-                            self.mutable_globals.add(target.name)
+            elif type(node.value) in self._MUTABLE_TYPE_SET:
+                for target in node.targets:
+                    if isinstance(target, astroid.AssignName):
+                        self.mutable_globals.add(target.name)
         else:
             for target in node.targets:
                 if isinstance(target, astroid.AssignName) and (
@@ -115,12 +125,14 @@ class AvoidGlobalVars(BaseChecker):
 
     def visit_call(self, node: nodes.Call) -> None:
         """Check for any method calls are made on global variables(e.g., dict.update)"""
-        if isinstance(node.func, astroid.Attribute):
-            if (
-                isinstance(node.func.expr, astroid.Name)
-                and node.func.attrname in self.MUTATE_METHODS
-            ):
-                self._check_valid_update(node.func, node.func.expr.name)
+        func = node.func
+        # The method name check rules out almost every call, so do it first
+        if (
+            isinstance(func, astroid.Attribute)
+            and func.attrname in self.MUTATE_METHODS
+            and isinstance(func.expr, astroid.Name)
+        ):
+            self._check_valid_update(func, func.expr.name)
 
     def visit_augassign(self, node: nodes.AugAssign) -> None:
         """Check for augmented assignments (e.g., +=, -=, etc.) to global variables"""
@@ -129,7 +141,7 @@ class AvoidGlobalVars(BaseChecker):
 
     def visit_subscript(self, node: nodes.Subscript) -> None:
         """Check for subscript assignments (e.g., dict["key"] = value, list[index] = value) on global variables"""
-        if isinstance(node.value, astroid.Name) and str(node.ctx) == "Context.Store":
+        if isinstance(node.value, astroid.Name) and node.ctx is Context.Store:
             self._check_valid_update(node, node.value.name)
 
     def visit_global(self, node: nodes.Global) -> None:
@@ -138,6 +150,7 @@ class AvoidGlobalVars(BaseChecker):
 
     def visit_functiondef(self, node: nodes.FunctionDef) -> None:
         """Reset the current globals for each function scope"""
+        super().visit_functiondef(node)
         self.current_globals = set()
 
 
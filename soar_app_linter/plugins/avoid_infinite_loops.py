@@ -16,8 +16,6 @@ import astroid
 
 
 class AvoidInfiniteLoops(BaseChecker):
-    __implements__ = BaseChecker
-
     name = "no-infinite-loops"
     priority = -1
     msgs = {
@@ -33,40 +31,39 @@ Please check the loop for a valid break or return to avoid an infinite loop.",
     def __init__(self, linter: PyLinter) -> None:
         super().__init__(linter)
 
-    # looks for a break somewhere, and doesn't recurse through nested loops.
-    def does_it_break(self, node: nodes.NodeNG) -> bool:
-        if isinstance(node, astroid.node_classes.Break):
-            return True
-        children = node.get_children()
-        is_there_break: bool = False
-
-        for child in children:
-            if isinstance(child, astroid.node_classes.While) or isinstance(
-                child, astroid.node_classes.For
-            ):
-                continue
-            is_there_break = is_there_break or self.does_it_break(child)
-
-        return is_there_break
+    # looks for a return statement anywhere, or a break that isn't inside a nested loop.
+    # walks the subtree once with an explicit stack and stops at the first match
+    def does_it_exit(self, node: nodes.NodeNG) -> bool:
+        pending = [(node, False)]
+        while pending:
+            current, in_nested_loop = pending.pop()
+            if isinstance(current, nodes.Return):
+                return True
+            if isinstance(current, nodes.Break) and not in_nested_loop:
+                return True
 
-    # looks for a return statement anywhere. recurses through children
-    def does_it_return(self, node: nodes.NodeNG) -> bool:
-        if isinstance(node, astroid.node_classes.Return):
-            return True
-        children = node.get_children()
-        is_there_return = False
+            # breaks inside a nested loop only exit that loop
+            children_in_nested_loop = in_nested_loop or (
+                current is not node and isinstance(current, (nodes.While, nodes.For))
+            )
+            pending.extend(
+                (child, children_in_nested_loop) for child in current.get_children()
+            )
 
-        for child in children:
-            is_there_return = is_there_return or self.does_it_return(child)
-
-        return is_there_return
+        return False
 
     # implementing the pylint checker method that visits all while nodes
     def visit_while(self, node: nodes.While) -> None:
+        # literal tests (e.g. while True / while 1) are the common case and infer to themselves
+        if isinstance(node.test, nodes.Const):
+            if node.test.value and not self.does_it_exit(node):
+                self.add_message("no-infinite-loops", node=node)
+            return
+
         try:
             inferred = next(node.test.infer())
             if hasattr(inferred, "value") and inferred.value:
-                if not (self.does_it_return(node) or self.does_it_break(node)):
+                if not self.does_it_exit(node):
                     self.add_message("no-infinite-loops", node=node)
         except astroid.exceptions.InferenceError:
             # failed to infer value of the while test condition
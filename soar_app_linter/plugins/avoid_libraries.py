@@ -7,10 +7,19 @@ from pylint.lint import PyLinter  # noqa: PH107 avoid pylint imports
 
 PRODUCT_NAME = "Splunk SOAR"  # noqa: PH110 use get_product_name()
 
+# each message is used as both the short and the long description
+REQUESTS_MESSAGE = (
+    "Using the requests library is not recommended. "
+    f"Where possible, use the {PRODUCT_NAME} HTTP app instead."
+)
+LXML_MESSAGE = (
+    "Using the lxml library is not recommended. Where possible, use another library, "
+    "such as html5lib or html.parser instead."
+)
+PSYCOPG2_MESSAGE = "Using the psycopg2 library is not recommended. Where possible, use the SOAR API instead."
 
-class AvoidLibraries(BaseChecker):
-    __implements__ = BaseChecker
 
+class AvoidLibraries(BaseChecker):
     name = "not-recommended-libraries"
 
     @staticmethod
@@ -20,28 +29,29 @@ class AvoidLibraries(BaseChecker):
     priority = -1
     msgs = {
         "W0003": (
-            "Using the requests library is not recommended. "
-            f"Where possible, use the {PRODUCT_NAME} HTTP app instead.",
+            REQUESTS_MESSAGE,
             "not-recommended-libraries-requests",
-            "Using the requests library is not recommended. "
-            f"Where possible, use the {PRODUCT_NAME} HTTP app instead.",
+            REQUESTS_MESSAGE,
         ),
         "W0004": (
-            "Using the lxml library is not recommended. Where possible, use another library, \
-such as html5lib or html.parser instead.",
+            LXML_MESSAGE,
             "not-recommended-libraries-lxml",
-            "Using the lxml library is not recommended. Where possible, use another library, \
-such as html5lib or html.parser instead.",
+            LXML_MESSAGE,
         ),
         # the number skips a bunch because of other existing lints
         "W0008": (
-            "Using the psycopg2 library is not recommended. Where possible, use the SOAR API instead.",
+            PSYCOPG2_MESSAGE,
             "not-recommended-libraries-psycopg2",
-            "Using the psycopg2 library is not recommended. Where possible, use the SOAR API instead.",
+            PSYCOPG2_MESSAGE,
         ),
     }
-    # add more libraries that aren't recommended in playbooks to this set
-    libraries_to_avoid = set(["requests", "lxml", "psycopg2"])
+    # add more libraries that aren't recommended in playbooks to this tuple
+    libraries_to_avoid = ("requests", "lxml", "psycopg2")
+    # library -> get_message_id(library), built once rather than per reported import
+    _MESSAGE_IDS = {
+        library: f"not-recommended-libraries-{library}"
+        for library in libraries_to_avoid
+    }
 
     def __init__(self, linter: PyLinter) -> None:
         super().__init__(linter)
@@ -49,14 +59,18 @@ such as html5lib or html.parser instead.",
     # implementing the pylint checker method that visits all import nodes
     def visit_import(self, node: nodes.Import) -> None:
         # check if any of the unrecommended libraries are imported
-        imported_libraries = {name[0] for name in node.names}
-        for library in imported_libraries & self.libraries_to_avoid:
-            self.add_message(AvoidLibraries.get_message_id(library), node=node)
+        message_ids = self._MESSAGE_IDS
+        # a set so importing the same library twice in one statement reports it once
+        for message_id in {
+            message_ids[name] for name, _ in node.names if name in message_ids
+        }:
+            self.add_message(message_id, node=node)
 
     # implementing the pylint checker method that visits all importfrom nodes
     def visit_importfrom(self, node: nodes.ImportFrom) -> None:
-        if node.modname in self.libraries_to_avoid:
-            self.add_message(AvoidLibraries.get_message_id(node.modname), node=node)
+        message_id = self._MESSAGE_IDS.get(node.modname)
+        if message_id:
+            self.add_message(message_id, node=node)
 
 
 def register(linter):
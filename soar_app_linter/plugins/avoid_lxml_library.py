@@ -1,13 +1,17 @@
 from astroid import nodes
-from pylint.checkers import BaseChecker  # noqa: PH107 avoid pylint imports
 
 import astroid
 from pylint.lint import PyLinter  # noqa: PH107 avoid pylint imports
 
+from .alias_tracking import AliasTrackingChecker
 
-class AvoidLxml(BaseChecker):
-    __implements__ = BaseChecker
+# constants
+BS4 = "bs4"
+BEAUTIFUL_SOUP = "BeautifulSoup"
+PARSER_ARG_KEYWORD = "features"
 
+
+class AvoidLxml(AliasTrackingChecker):
     name = "no-lxml"
     msgs = {
         "W0005": (
@@ -26,41 +30,36 @@ Where possible, use another library, such as html5lib or html.parser instead.",
         self.bs4_aliases: set[str] = set()
         self.soup_aliases: set[str] = set()
         self.lxml_lib = set(["lxml", "lxml-xml", "xml"])
-        # constants
-        self.BS4 = "bs4"
-        self.BEAUTIFUL_SOUP = "BeautifulSoup"
-        self.PARSER_ARG_KEYWORD = "features"
 
-    # implementing the pylint checker method that visits all import nodes
-    def visit_import(self, node: nodes.Import) -> None:
+    def _track_bs4_import(self, bound_name: str) -> None:
+        # add 'bs4' to the alias set if the alias doesn't exist, otherwise add the alias
+        self.bs4_aliases.add(bound_name)
+
+    def _track_bs4_importfrom(self, node: nodes.ImportFrom) -> None:
         for name in node.names:
-            # import name[0] as name[1]
-            if name[0] == self.BS4:
-                # add 'bs4' to the alias set if the alias doesn't exist, otherwise add the alias
-                self.bs4_aliases.add(name[1] or name[0])
-
-    # implementing the pylint checker method that visits all importfrom nodes
-    def visit_importfrom(self, node: nodes.ImportFrom) -> None:
-        if node.modname == self.BS4:
-            for name in node.names:
-                # from bs4 import name[0] as name[1]
-                if name[0] == self.BEAUTIFUL_SOUP:
-                    # add 'BeautifulSoup' to the alias set if the alias doesn't exist, otherwise add the alias
-                    self.soup_aliases.add(name[1] or name[0])
+            # from bs4 import name[0] as name[1]
+            if name[0] == BEAUTIFUL_SOUP:
+                # add 'BeautifulSoup' to the alias set if the alias doesn't exist, otherwise add the alias
+                self.soup_aliases.add(name[1] or name[0])
+
+    def leave_module(self, node: nodes.Module) -> None:
+        # aliases only apply to the module that imported them
+        self.bs4_aliases.clear()
+        self.soup_aliases.clear()
 
     def is_beautiful_soup_call(self, node: nodes.Call) -> bool:
         # check if the function call is foo.bar()
-        if isinstance(node.func, astroid.node_classes.Attribute) and isinstance(
-            node.func.expr, astroid.node_classes.Name
+        if isinstance(node.func, nodes.Attribute) and isinstance(
+            node.func.expr, nodes.Name
         ):
             # check if the function call is bs4.BeautifulSoup()
             if (
-                node.func.attrname == self.BEAUTIFUL_SOUP
+                node.func.attrname == BEAUTIFUL_SOUP
                 and node.func.expr.name in self.bs4_aliases
             ):
                 return True
 
-        elif isinstance(node.func, astroid.node_classes.Name):
+        elif isinstance(node.func, nodes.Name):
             # check if the function call is BeautifulSoup()
             if node.func.name in self.soup_aliases:
                 return True
@@ -68,33 +67,37 @@ Where possible, use another library, such as html5lib or html.parser instead.",
         return False
 
     def check_literal_value(self, node: nodes.NodeNG) -> None:
-        # if the node is a literal, check its direct value
-        if isinstance(node, astroid.node_classes.Const) and node.value in self.lxml_lib:
-            self.add_message("no-lxml", node=node)
+        # if the node is a literal, check its direct value, inferring it would only return itself
+        if isinstance(node, nodes.Const):
+            if node.value in self.lxml_lib:
+                self.add_message("no-lxml", node=node)
         else:
-            # the node isn't a literal, try to infer its value
+            # the node is a variable, expression or call, try to infer its value
             try:
-                inferred = next(node.infer())
-                if (
-                    isinstance(inferred, astroid.node_classes.Const)
-                    and inferred.value is not None
-                ):
-                    if inferred.value in self.lxml_lib:
-                        self.add_message("no-lxml", node=node)
+                # None when nothing could be inferred, instead of raising StopIteration
+                inferred = next(node.infer(), None)
             except astroid.exceptions.InferenceError:
                 # failed to infer value of the variable passed
-                pass
-            except StopIteration:
-                pass
+                return
+            if isinstance(inferred, nodes.Const) and inferred.value in self.lxml_lib:
+                self.add_message("no-lxml", node=node)
 
     # implementing the pylint checker method that visits all function call nodes
     def visit_call(self, node: nodes.Call) -> None:
+        # nothing to look for until bs4 or bs4.BeautifulSoup has been imported
+        if not self.bs4_aliases and not self.soup_aliases:
+            return
+
         if self.is_beautiful_soup_call(node):
             # check the named arguments
             if node.keywords:
                 # look for the keyword for the parser argument
                 for k in node.keywords:
-                    if k.arg.lower() == self.PARSER_ARG_KEYWORD:
+                    # exact match first to skip lowering the keyword in the common case,
+                    # k.arg is None for **kwargs
+                    if k.arg == PARSER_ARG_KEYWORD or (
+                        k.arg is not None and k.arg.lower() == PARSER_ARG_KEYWORD
+                    ):
                         # pass the rhs to check for literal value and look for lxml usage
                         self.check_literal_value(k.value)
                         return
@@ -108,6 +111,10 @@ Where possible, use another library, such as html5lib or html.parser instead.",
                 # no parser was passed explicitly; default parser(lxml) was used
                 self.add_message("no-lxml", node=node)
 
+    # imported module -> alias tracking, dispatched by AliasTrackingChecker
+    IMPORT_HANDLERS = {BS4: _track_bs4_import}
+    IMPORTFROM_HANDLERS = {BS4: _track_bs4_importfrom}
+
 
 def register(linter):
     linter.register_checker(AvoidLxml(linter))
@@ -1,12 +1,7 @@
-from pylint.checkers import BaseChecker  # noqa: PH107 avoid pylint imports
-
-
 from .banned_functions import BannedFunctions
 
 
 class AvoidShellAccess(BannedFunctions):
-    __implements__ = BaseChecker
-
     name = "avoid-shell-access"
 
     BANNED_FUNCTIONS_MAP = {
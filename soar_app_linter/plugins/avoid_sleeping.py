@@ -1,13 +1,15 @@
 from astroid import nodes
-from pylint.checkers import BaseChecker  # noqa: PH107 avoid pylint imports
 
-import astroid
 from pylint.lint import PyLinter  # noqa: PH107 avoid pylint imports
 
+from .alias_tracking import AliasTrackingChecker
 
-class AvoidSleeping(BaseChecker):
-    __implements__ = BaseChecker
+# constants
+TIME = "time"
+SLEEP = "sleep"
 
+
+class AvoidSleeping(AliasTrackingChecker):
     name = "no-sleeps"
     priority = -1
     msgs = {
@@ -23,45 +25,49 @@ class AvoidSleeping(BaseChecker):
         # the aliases are sets because in python its valid to import a library more than once
         self.time_aliases: set[str] = set()
         self.sleep_aliases: set[str] = set()
-        # constants
-        self.TIME = "time"
-        self.SLEEP = "sleep"
 
-    # implementing the pylint checker method that visits all import nodes
-    def visit_import(self, node: nodes.Import) -> None:
+    def _track_time_import(self, bound_name: str) -> None:
+        # add 'time' to the alias set if the alias doesn't exist, otherwise add the alias
+        self.time_aliases.add(bound_name)
+
+    def _track_time_importfrom(self, node: nodes.ImportFrom) -> None:
         for name in node.names:
-            # import name[0] as name[1]
-            if name[0] == self.TIME:
-                # add 'time' to the alias set if the alias doesn't exist, otherwise add the alias
-                self.time_aliases.add(name[1] or name[0])
+            # from time import name[0] as name[1]
+            if name[0] == SLEEP:
+                # add 'sleep' to the alias set if the alias doesn't exist, otherwise add the alias
+                self.sleep_aliases.add(name[1] or name[0])
 
-    # implementing the pylint checker method that visits all importfrom nodes
-    def visit_importfrom(self, node: nodes.ImportFrom) -> None:
-        if node.modname == self.TIME:
-            for name in node.names:
-                # from time import name[0] as name[1]
-                if name[0] == self.SLEEP:
-                    # add 'sleep' to the alias set if the alias doesn't exist, otherwise add the alias
-                    self.sleep_aliases.add(name[1] or name[0])
+    def leave_module(self, node: nodes.Module) -> None:
+        # aliases only apply to the module that imported them
+        self.time_aliases.clear()
+        self.sleep_aliases.clear()
 
     # implementing the pylint checker method that visits all function call nodes
     def visit_call(self, node: nodes.Call) -> None:
+        # nothing to look for until time or time.sleep has been imported
+        if not self.time_aliases and not self.sleep_aliases:
+            return
+
+        func = node.func
         # check if the function call is foo.bar()
-        if isinstance(node.func, astroid.node_classes.Attribute) and isinstance(
-            node.func.expr, astroid.node_classes.Name
-        ):
-            # check if the function call is time.sleep()
+        if isinstance(func, nodes.Attribute):
+            # check if the function call is time.sleep(), comparing the method name first
             if (
-                node.func.attrname == self.SLEEP
-                and node.func.expr.name in self.time_aliases
+                func.attrname == SLEEP
+                and isinstance(func.expr, nodes.Name)
+                and func.expr.name in self.time_aliases
             ):
                 self.add_message("no-sleeps", node=node)
 
-        elif isinstance(node.func, astroid.node_classes.Name):
+        elif isinstance(func, nodes.Name):
             # check if the function call is sleep()
-            if node.func.name in self.sleep_aliases:
+            if func.name in self.sleep_aliases:
                 self.add_message("no-sleeps", node=node)
 
+    # imported module -> alias tracking, dispatched by AliasTrackingChecker
+    IMPORT_HANDLERS = {TIME: _track_time_import}
+    IMPORTFROM_HANDLERS = {TIME: _track_time_importfrom}
+
 
 def register(linter):
     linter.register_checker(AvoidSleeping(linter))
@@ -1,7 +1,5 @@
 from astroid import nodes
 
-from pylint.lint import PyLinter  # noqa: PH107 avoid pylint imports
-
 from .avoid_deprecation_base import AvoidDeprecationBase
 
 
@@ -13,20 +11,41 @@ class BannedFunctions(AvoidDeprecationBase):
     msgs = {}
     name = ""
 
-    def __init__(self, linter: PyLinter) -> None:
-        super().__init__(linter)
+    # Flattened dotted names, so each visited call is a single lookup. Built once per class
+    # from BANNED_FUNCTIONS_MAP when the subclass is defined
+    banned_functions: frozenset[str] = frozenset()
+    # Last part of each banned name, to rule out most calls before resolving their full name
+    banned_tails: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
 
-        self.banned_functions: set[str] = set()
+        banned_functions: set[str] = set()
 
-        for k, v in self.BANNED_FUNCTIONS_MAP.items():
+        for k, v in cls.BANNED_FUNCTIONS_MAP.items():
             for v1 in v:
-                self.banned_functions.add(f"{k}.{v1}")
+                banned_functions.add(f"{k}.{v1}")
 
             if not v:
-                self.banned_functions.add(k)
+                banned_functions.add(k)
+
+        cls.banned_functions = frozenset(banned_functions)
+        cls.banned_tails = frozenset(
+            name.rpartition(".")[2] for name in cls.banned_functions
+        )
 
     # implementing the pylint checker method that visits all function call nodes
     def visit_call(self, node: nodes.Call) -> None:
+        func = node.func
+        if isinstance(func, nodes.Attribute):
+            if func.attrname not in self.banned_tails:
+                return
+        elif isinstance(func, nodes.Name):
+            # names may be aliases (e.g. from os import system as run)
+            resolved_name = self.alias_map.get(func.name, func.name)
+            if resolved_name.rpartition(".")[2] not in self.banned_tails:
+                return
+
         full_name = self._resolve_full_name(node)
         if full_name in self.banned_functions:
             self.add_message(self.MESSAGE, node=node)
@@ -0,0 +1,31 @@
+from astroid import nodes
+
+
+class ModuleLevelMixin:
+    """Shared module-level scope detection for checkers."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        # number of enclosing class and function definitions of the node being visited
+        self._scope_depth = 0
+        super().__init__(*args, **kwargs)
+
+    def visit_functiondef(self, node: nodes.FunctionDef) -> None:
+        self._scope_depth += 1
+
+    def leave_functiondef(self, node: nodes.FunctionDef) -> None:
+        self._scope_depth -= 1
+
+    visit_asyncfunctiondef = visit_functiondef
+    leave_asyncfunctiondef = leave_functiondef
+
+    def visit_classdef(self, node: nodes.ClassDef) -> None:
+        self._scope_depth += 1
+
+    def leave_classdef(self, node: nodes.ClassDef) -> None:
+        self._scope_depth -= 1
+
+    def _is_module_level(self, node: nodes.NodeNG) -> bool:
+        """Determine if the node is at module level, i.e. not inside a class or function"""
+        # decorators, arguments and class bases are visited after their definition node,
+        # so they count as inside it just like when walking up the parents
+        return self._scope_depth == 0
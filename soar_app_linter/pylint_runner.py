@@ -1,18 +1,25 @@
 """Pylint runner for SOAR apps."""
 
+import hashlib
 import logging
 import os
 from importlib import resources as importlib_resources
 import subprocess
 import sys
+import sysconfig
 from enum import Enum
 from pathlib import Path
-from typing import List, Union
+from typing import Iterator, List, Union
 import re
 import json
 
 logger = logging.getLogger(__name__)
 
+# Cached pylint output of the latest run per repo, with a key of everything that can change it
+RESULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "soar-app-linter"
+)
+
 
 class MessageLevel(str, Enum):
     """Message severity levels."""
@@ -90,6 +97,21 @@ ALLOWED_E0401_IMPORT_NAMES = {
 }
 
 
+def _iter_python_files(directory: Path) -> Iterator[Path]:
+    """Yield the non-hidden Python files under directory, outside .venv."""
+    for root, dirs, filenames in os.walk(directory):
+        # prune in place so os.walk never descends into the venv
+        dirs[:] = sorted(d for d in dirs if d != ".venv")
+        for filename in sorted(filenames):
+            if filename.endswith(".py") and not filename.startswith("."):
+                yield Path(root) / filename
+
+
+def _cpu_count() -> int:
+    """Return the number of CPUs pylint jobs can use."""
+    return os.cpu_count() or 1
+
+
 def _find_python_files(
     directory: Union[str, Path], use_relative_paths: bool = False
 ) -> List[str]:
@@ -108,11 +130,8 @@ def _find_python_files(
         return []
 
     files = []
-    for path in directory.rglob("*.py"):
-        # Skip files in .venv
-        if any(part == ".venv" for part in path.parts):
-            continue
-        if path.is_file() and not path.name.startswith("."):
+    for path in _iter_python_files(directory):
+        if path.is_file():
             logger.debug(f"Found Python file: {path}")
             if use_relative_paths:
                 # Use path relative to the directory for local imports to work correctly
@@ -219,6 +238,84 @@ def _ensure_init_files(directory: str) -> None:
         logger.debug("No new __init__.py files were needed")
 
 
+def _compute_run_key(
+    cmd: List[str],
+    working_dir: Union[str, None],
+    repo_root: Path,
+    venv_site_packages: Union[Path, None],
+) -> str:
+    """Hash the inputs that determine the output of a pylint run."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{cmd}\0{working_dir}\0".encode())
+    # Modules reached through PYTHONPATH aren't otherwise part of the key, at least
+    # notice when the path itself changes
+    digest.update(f"{os.environ.get('PYTHONPATH', '')}\0".encode())
+
+    # The plugins and rcfile the run loads
+    linter_files = sorted(Path(__file__).parent.glob("plugins/*.py"))
+    linter_files.append(Path(__file__).parent / "pylintrc.app")
+    # The interpreter and installed packages, without a repo venv this is our own environment
+    site_packages = venv_site_packages or Path(sysconfig.get_paths()["purelib"])
+    for stat_path in (Path(cmd[0]), site_packages):
+        try:
+            digest.update(f"{stat_path}\0{stat_path.stat().st_mtime_ns}\0".encode())
+        except OSError:
+            digest.update(f"{stat_path}\0<missing>\0".encode())
+
+    # Every module of the repo that pylint lints, since linted files can import each other
+    source_files = list(_iter_python_files(repo_root))
+    for path in linter_files + source_files:
+        digest.update(f"{path}\0".encode())
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(b"<missing>")
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _cache_file(repo_root: Path) -> Path:
+    """Return the result cache file of a repo, which only holds its latest run."""
+    name = hashlib.blake2b(str(repo_root).encode(), digest_size=16).hexdigest()
+    return RESULT_CACHE_DIR / f"{name}.json"
+
+
+def _read_cached_output(repo_root: Path, run_key: str) -> Union[str, None]:
+    """Return the pylint output cached for the repo if its latest run had the given key."""
+    try:
+        cached = json.loads(_cache_file(repo_root).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != run_key:
+        return None
+    return cached.get("stdout")
+
+
+def _write_cached_output(repo_root: Path, run_key: str, stdout: str) -> None:
+    """Atomically replace the cached pylint output of the repo with this run's."""
+    cache_file = _cache_file(repo_root)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        RESULT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps({"key": run_key, "stdout": stdout}))
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Could not write pylint result cache {cache_file}: {e}")
+
+
+def _execute_pylint(
+    cmd: List[str], working_dir: Union[str, None]
+) -> subprocess.CompletedProcess:
+    """Run the pylint command and capture its output."""
+    return subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=working_dir,
+    )
+
+
 def _has_errors_in_output(
     output: str, output_format: str, conflicting_modules: set[str]
 ) -> bool:
@@ -322,6 +419,7 @@ def run_pylint(
     verbose: bool = False,
     message_level: MessageLevel = MessageLevel.INFO,
     no_deps: bool = False,
+    use_cache: bool = True,
 ) -> tuple[int, str]:
     """Run pylint on the target directory or file.
 
@@ -331,6 +429,7 @@ def run_pylint(
         verbose: Enable verbose output
         message_level: Minimum message level to show
         no_deps: If True, skip dependency installation and ignore import errors
+        use_cache: If True, reuse the output of the previous run if its inputs are identical
 
     Returns:
         tuple: (exit_code, output)
@@ -454,6 +553,11 @@ def run_pylint(
         if not files:
             logger.warning(f"No Python files found in {target}")
             return 0, ""
+        # Lint files in parallel, each pylint job is a separate worker process. The
+        # checkers reset their state per module, so results match a serial run
+        jobs = min(_cpu_count(), len(files))
+        if jobs > 1:
+            cmd.append(f"--jobs={jobs}")
         cmd.extend(files)
     else:
         if not os.path.exists(target):
@@ -463,30 +567,35 @@ def run_pylint(
         working_dir = None
         cmd.append(target)
 
-    logger.debug(f"Running command: {' '.join(cmd)}")
+    run_key = (
+        _compute_run_key(cmd, working_dir, repo_root, venv_site_packages)
+        if use_cache
+        else None
+    )
+    stdout = _read_cached_output(repo_root, run_key) if run_key else None
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False,
-            cwd=working_dir,
-        )
+        if stdout is not None:
+            logger.debug(f"Reusing cached pylint output for: {target}")
+        else:
+            logger.debug(f"Running command: {' '.join(cmd)}")
+            result = _execute_pylint(cmd, working_dir)
+            stdout = result.stdout
 
-        # Log stderr if present
-        if result.stderr:
-            logger.error(f"Pylint stderr: {result.stderr}")
+            # Log stderr if present
+            if result.stderr:
+                logger.error(f"Pylint stderr: {result.stderr}")
+            # Only cache complete runs, pylint sets bit 1 on fatal errors and 32 on usage errors
+            elif run_key and not result.returncode & 33:
+                _write_cached_output(repo_root, run_key, stdout)
 
         # Check if there were any errors in the output
         conflicting_modules = _detect_namespace_conflict(repo_root)
-        has_errors = _has_errors_in_output(
-            result.stdout, output_format, conflicting_modules
-        )
+        has_errors = _has_errors_in_output(stdout, output_format, conflicting_modules)
 
         # Determine failure based on filtered errors, not raw pylint return code (filtered imports don't contribute)
         exit_code = 1 if has_errors else 0
-        return exit_code, result.stdout
+        return exit_code, stdout
 
     except subprocess.CalledProcessError as e:
         logger.error(f"Error running pylint: {e!s}")
@@ -0,0 +1,48 @@
+"""Assertion helpers for lint results decoded from pylint's json output."""
+
+import itertools
+
+
+def find(
+    results: list[dict],
+    *,
+    message_type: str | None = None,
+    message_contains: str | None = None,
+    symbol_contains: str | None = None,
+) -> dict | None:
+    """Return the first json message matching all the given criteria, or None."""
+    for result in results:
+        if message_type is not None and result.get("type") != message_type:
+            continue
+        if message_contains is not None and message_contains not in result.get(
+            "message", ""
+        ):
+            continue
+        if symbol_contains is not None and symbol_contains not in result.get(
+            "symbol", ""
+        ):
+            continue
+        return result
+    return None
+
+
+def preview(results: list[dict], limit: int = 10) -> list[dict]:
+    """Return the first few messages, to keep failure output short on large apps."""
+    return list(itertools.islice(results, limit))
+
+
+def assert_clean(
+    exit_code: int, results: list[dict], *, allow_type: str | None = None
+) -> None:
+    """Assert that a lint run passed without reporting error or fatal messages.
+
+    ``allow_type`` exempts one of those message types from the check.
+    """
+    assert exit_code == 0, (
+        f"Expected exit code 0, got {exit_code}. Output: {preview(results)}"
+    )
+    for message_type in ("error", "fatal"):
+        if message_type == allow_type:
+            continue
+        message = find(results, message_type=message_type)
+        assert message is None, f"Found {message_type} in output: {message}"
@@ -1,10 +1,20 @@
 """Pytest configuration and fixtures."""
 
+import contextlib
+import functools
+import io
+import json
+import os
+import subprocess
+import sys
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
 
 import pytest
+from astroid import MANAGER
+from pylint.lint import Run
 
+from soar_app_linter import pylint_runner
 from soar_app_linter.pylint_runner import run_pylint, MessageLevel
 
 
@@ -38,25 +48,112 @@ def import_test_dir(test_data_dir: Path) -> Path:
     return test_data_dir / "import_test"
 
 
-@pytest.fixture()
-def run_linter() -> Callable[..., tuple[int, str]]:
-    """Fixture to run the linter with the given arguments."""
+@pytest.fixture(scope="session")
+def dependency_files_dir(test_data_dir: Path) -> Path:
+    """Return the path to the read-only dependency file samples."""
+    return test_data_dir / "dependency_files"
+
+
+_execute_pylint_in_subprocess = pylint_runner._execute_pylint
+
+
+# The apps under tests/data are never modified, so their parsed modules stay valid
+_READ_ONLY_APPS_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", ""
+)
+
+# The tests/data app whose modules are in astroid's cache from the previous run, if any
+_cached_app_dir: str | None = None
+
+
+def _reset_astroid_cache(app_dir: str) -> None:
+    """Clear astroid's caches unless the previous run linted the same tests/data app.
+
+    Astroid caches modules by name, so another app, or a copy of an app edited in a
+    temporary directory, would otherwise be served the previous run's modules. The apps
+    under tests/data never change, so linting one again reuses its parsed modules.
+    """
+    global _cached_app_dir
+    app_dir = os.path.join(os.path.abspath(app_dir), "")
+    if app_dir != _cached_app_dir:
+        MANAGER.clear_cache()
+    _cached_app_dir = app_dir if app_dir.startswith(_READ_ONLY_APPS_DIR) else None
+
+
+def _execute_pylint_in_process(
+    cmd: list[str], working_dir: str | None
+) -> subprocess.CompletedProcess:
+    """Run a "<python> -m pylint ..." command in this interpreter instead of a new one."""
+    if cmd[0] != sys.executable:
+        # the target has its own venv, which only a subprocess can use
+        return _execute_pylint_in_subprocess(cmd, working_dir)
+
+    # lint serially, jobs would parse in forked workers and forking from a threaded
+    # xdist worker can deadlock, the checkers report the same either way
+    args = [arg for arg in cmd[3:] if not arg.startswith("--jobs=")]
+    _reset_astroid_cache(working_dir or os.path.dirname(cmd[-1]))
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    sys_path = list(sys.path)
+    try:
+        with (
+            contextlib.chdir(working_dir or os.getcwd()),
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+        ):
+            run = Run(args, exit=False)
+    finally:
+        # undo the --init-hook path changes
+        sys.path[:] = sys_path
+    return subprocess.CompletedProcess(
+        cmd, run.linter.msg_status, stdout.getvalue(), stderr.getvalue()
+    )
+
+
+@pytest.fixture(scope="session")
+def execute_pylint() -> Callable[..., subprocess.CompletedProcess]:
+    """Return a replacement for pylint_runner._execute_pylint that runs in this process."""
+    return _execute_pylint_in_process
+
+
+@pytest.fixture(scope="session")
+def run_linter() -> Callable[..., tuple[int, Any]]:
+    """Fixture to run the linter with the given arguments.
+
+    Several tests lint the same directory with the same arguments, so the results are
+    shared for the whole session instead of starting pylint again for each of them.
+    Pylint runs in the test process, so its imports are only paid for once.
+
+    With output_format="python" the output is the list of message dicts of the json
+    format, decoded once per run rather than by every test that looks at it.
+    """
 
+    @functools.cache
     def _run_linter(
         target: str,
         output_format: str = "text",
         message_level: MessageLevel | None = None,
         no_deps: bool = False,
-    ) -> tuple[int, str]:
+    ) -> tuple[int, Any]:
         """Run the linter with the given arguments."""
         if message_level is None:
             message_level = MessageLevel.INFO
 
-        return run_pylint(
-            target=target,
-            output_format=output_format,
-            message_level=message_level,
-            no_deps=no_deps,
-        )
+        if output_format == "python":
+            exit_code, output = _run_linter(target, "json", message_level, no_deps)
+            try:
+                return exit_code, json.loads(output)
+            except json.JSONDecodeError:
+                pytest.fail(f"Failed to parse JSON output: {output}")
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(pylint_runner, "_execute_pylint", _execute_pylint_in_process)
+            return run_pylint(
+                target=target,
+                output_format=output_format,
+                message_level=message_level,
+                no_deps=no_deps,
+                use_cache=False,
+            )
 
     return _run_linter
@@ -0,0 +1 @@
+# Automatically generated by pylint-runner
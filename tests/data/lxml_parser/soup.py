@@ -0,0 +1,15 @@
+from bs4 import BeautifulSoup
+
+PREFIX = "lx"
+
+
+def parser_name():
+    return "lxml"
+
+
+def parse(markup):
+    BeautifulSoup(markup, "lx" + "ml")
+    BeautifulSoup(markup, f"{PREFIX}ml")
+    BeautifulSoup(markup, parser_name())
+    BeautifulSoup(markup, features=PREFIX + "ml")
+    BeautifulSoup(markup, "html.parser")
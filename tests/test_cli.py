@@ -1,133 +1,210 @@
 """Tests for the soar-app-linter CLI."""
 
 import json
+import shutil
+import subprocess
 from pathlib import Path
 from collections.abc import Callable
+from typing import Any
 
 import pytest
 
-from soar_app_linter.pylint_runner import MessageLevel
+from soar_app_linter import pylint_runner
+from soar_app_linter.pylint_runner import MessageLevel, run_pylint
+
+from _helpers import assert_clean, find, preview
+
+
+# (test data app, run_linter options, expected message text). Apps with an expected
+# message must fail the run and report it, the others must lint clean.
+LINT_CASES = [
+    pytest.param("good_app", {}, None, id="good_app"),
+    # importing a module removed in python 3.13 fails
+    pytest.param(
+        "bad_import",
+        {"message_level": MessageLevel.ERROR},
+        "distutils.util",
+        id="bad_import",
+    ),
+    # --no-deps disables import errors
+    pytest.param(
+        "bad_import",
+        {"message_level": MessageLevel.ERROR, "no_deps": True},
+        None,
+        id="bad_import_no_deps",
+    ),
+]
+
+
+@pytest.mark.parametrize(("app", "options", "expected_message"), LINT_CASES)
+def test_lint_app(
+    run_linter: Callable[..., tuple[int, Any]],
+    test_data_dir: Path,
+    app: str,
+    options: dict,
+    expected_message: str | None,
+) -> None:
+    """Test the exit code and messages of linting each test data app."""
+    exit_code, results = run_linter(
+        str(test_data_dir / app), output_format="python", **options
+    )
 
+    if expected_message is None:
+        assert_clean(exit_code, results)
+        return
 
-def test_good_app(
-    run_linter: Callable[..., tuple[int, str]], good_app_dir: Path
-) -> None:
-    """Test that a good app passes all linting checks."""
-    exit_code, output = run_linter(str(good_app_dir), output_format="json")
-
-    # Parse the JSON output
-    try:
-        results = json.loads(output)
-    except json.JSONDecodeError:
-        pytest.fail(f"Failed to parse JSON output: {output}")
-
-    # There should be no errors
-    assert exit_code == 0, f"Expected exit code 0, got {exit_code}. Output: {output}"
-    assert not any(result.get("type") == "error" for result in results), (
-        f"Found errors in output: {output}"
+    assert exit_code == 1, f"Expected exit code 1, got 0. Output: {preview(results)}"
+    if find(results, message_contains=expected_message) is None:
+        pytest.fail(f"Expected a message about {expected_message}: {preview(results)}")
+
+
+@pytest.fixture(scope="module")
+def custom_plugin_results(
+    run_linter: Callable[..., tuple[int, Any]], custom_plugin_dir: Path
+) -> dict[str, list[dict]]:
+    """Lint the custom plugin app once per message level."""
+    return {
+        level.value: run_linter(
+            str(custom_plugin_dir), output_format="python", message_level=level
+        )[1]
+        for level in (MessageLevel.INFO, MessageLevel.ERROR)
+    }
+
+
+def test_custom_plugin(custom_plugin_results: dict[str, list[dict]]) -> None:
+    """Test that our custom plugin detects the random.sample() issue."""
+    # Messages at INFO level include all of them
+    results = custom_plugin_results["info"]
+
+    # We should find our custom warning
+    if find(results, symbol_contains="consider-random-sample-sequence") is None:
+        pytest.fail(
+            "Expected 'consider-random-sample-sequence' warning, "
+            f"but got: {preview(results)}"
+        )
+
+
+def test_message_level_filtering(custom_plugin_results: dict[str, list[dict]]) -> None:
+    """Test that message level filtering works as expected."""
+    info_results = custom_plugin_results["info"]
+    error_results = custom_plugin_results["error"]
+
+    # Should have at least one message at INFO level
+    assert len(info_results) > 0, "Expected at least one message at INFO level"
+
+    # Should have fewer or no messages at ERROR level
+    assert len(error_results) <= len(info_results), (
+        f"Expected fewer or equal messages at ERROR level, got {len(error_results)} vs {len(info_results)}"
     )
 
 
-def test_bad_import(
-    run_linter: Callable[..., tuple[int, str]], bad_import_dir: Path
+def test_inferred_lxml_parser(
+    run_linter: Callable[..., tuple[int, Any]], test_data_dir: Path
 ) -> None:
-    """Test that importing a removed module in python 3.13 fails."""
-    # First test without --no-deps to ensure import errors are caught
-    exit_code, output = run_linter(
-        str(bad_import_dir), output_format="json", message_level=MessageLevel.ERROR
-    )
+    """Test that lxml parser names built by expressions or helper calls are reported."""
+    _, results = run_linter(str(test_data_dir / "lxml_parser"), output_format="python")
 
-    # Should fail with import error
-    assert exit_code != 0, "Expected non-zero exit code for import error"
+    lines = [result["line"] for result in results if result["symbol"] == "no-lxml"]
+    # the concatenation, f-string, helper call and keyword, not html.parser
+    assert sorted(lines) == [11, 12, 13, 14], preview(results)
 
-    # Now test with --no-deps to ensure import errors are ignored
-    exit_code, _ = run_linter(
-        str(bad_import_dir),
-        output_format="json",
-        message_level=MessageLevel.ERROR,
-        no_deps=True,
-    )
 
-    # Should pass when import errors are ignored
-    assert exit_code == 0, "Expected zero exit code with --no-deps"
+def test_only_venv_files_are_skipped(tmp_path: Path) -> None:
+    """Test that every Python file outside .venv is linted, even in build-like dirs."""
+    for relative_path in ("app.py", "build/gen.py", ".venv/lib/dep.py", ".hidden.py"):
+        path = tmp_path / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+    assert pylint_runner._find_python_files(tmp_path, use_relative_paths=True) == [
+        "app.py",
+        "build/gen.py",
+    ]
 
 
-def test_custom_plugin(
-    run_linter: Callable[..., tuple[int, str]], custom_plugin_dir: Path
+def test_unchanged_app_reuses_cached_output(
+    execute_pylint: Callable[..., subprocess.CompletedProcess],
+    custom_plugin_dir: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Test that our custom plugin detects the random.sample() issue."""
-    # Run with INFO level to see all messages
-    exit_code, output = run_linter(
-        str(custom_plugin_dir), output_format="json", message_level=MessageLevel.INFO
-    )
+    """Test that pylint only runs again once the linted sources change."""
+    monkeypatch.setattr(pylint_runner, "RESULT_CACHE_DIR", tmp_path / "cache")
+    app_dir = tmp_path / "app"
+    shutil.copytree(custom_plugin_dir, app_dir)
 
-    # Parse the JSON output
-    try:
-        results = json.loads(output)
-    except json.JSONDecodeError:
-        pytest.fail(f"Failed to parse JSON output: {output}")
+    pylint_runs = []
 
-    # We should find our custom warning
-    assert any(
-        "consider-random-sample-sequence" in result.get("symbol", "")
-        for result in results
-    ), f"Expected 'consider-random-sample-sequence' warning, but got: {results}"
+    def _counting_execute(cmd, working_dir):
+        pylint_runs.append(cmd)
+        return execute_pylint(cmd, working_dir)
+
+    monkeypatch.setattr(pylint_runner, "_execute_pylint", _counting_execute)
+
+    first = run_pylint(str(app_dir), output_format="json")
+    assert run_pylint(str(app_dir), output_format="json") == first
+    assert len(pylint_runs) == 1
 
+    with open(next(app_dir.glob("*.py")), "a") as f:
+        f.write("\nEXTRA = 1\n")
+    run_pylint(str(app_dir), output_format="json")
+    assert len(pylint_runs) == 2
+    # only the latest run of the app is kept
+    assert len(list((tmp_path / "cache").iterdir())) == 1
 
-def test_message_level_filtering(
-    run_linter: Callable[..., tuple[int, str]], custom_plugin_dir: Path
+
+@pytest.mark.slow
+def test_parallel_run_matches_serial(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Test that message level filtering works as expected."""
-    # First get all messages at INFO level
-    exit_code, output = run_linter(
-        str(custom_plugin_dir), output_format="json", message_level=MessageLevel.INFO
+    """Test that linting with several pylint jobs reports what a serial run does."""
+    # b.py uses names a.py defines, which must not leak into b.py in a serial run either
+    (tmp_path / "a.py").write_text(
+        "from os import system as run\nfrom io import open\nCACHE = {}\n"
+    )
+    (tmp_path / "b.py").write_text(
+        'def f():\n    run("ls")\n    CACHE.update()\n    return open("x")\n'
     )
 
-    # Parse the JSON output
-    try:
-        info_results = json.loads(output)
-    except json.JSONDecodeError:
-        pytest.fail(f"Failed to parse JSON output: {output}")
+    commands = []
+    # a real pylint process, forking jobs from the test process isn't safe under xdist
+    execute_pylint = pylint_runner._execute_pylint
 
-    # Should have at least one message at INFO level
-    assert len(info_results) > 0, "Expected at least one message at INFO level"
+    def _recording_execute(cmd, working_dir):
+        commands.append(cmd)
+        return execute_pylint(cmd, working_dir)
 
-    # Now run with ERROR level - should have fewer or no messages
-    exit_code, output = run_linter(
-        str(custom_plugin_dir), output_format="json", message_level=MessageLevel.ERROR
-    )
+    monkeypatch.setattr(pylint_runner, "_execute_pylint", _recording_execute)
 
-    # Parse the JSON output
-    try:
-        error_results = json.loads(output)
-    except json.JSONDecodeError:
-        pytest.fail(f"Failed to parse JSON output: {output}")
+    outputs = []
+    for cpu_count in (1, 2):
+        monkeypatch.setattr(pylint_runner, "_cpu_count", lambda n=cpu_count: n)
+        outputs.append(run_pylint(str(tmp_path), output_format="json", use_cache=False))
 
-    # Should have fewer or no messages at ERROR level
-    assert len(error_results) <= len(info_results), (
-        f"Expected fewer or equal messages at ERROR level, got {len(error_results)} vs {len(info_results)}"
+    assert not any(arg.startswith("--jobs") for arg in commands[0])
+    assert "--jobs=2" in commands[1]
+
+    serial, parallel = (
+        (exit_code, sorted(json.loads(output), key=json.dumps))
+        for exit_code, output in outputs
     )
+    assert find(serial[1], symbol_contains="no-filesystem-access") is not None
+    assert parallel == serial
 
 
-def test_no_deps_disables_import_errors(
-    run_linter: Callable[..., tuple[int, str]], bad_import_dir: Path
+@pytest.mark.slow
+def test_pylint_subprocess_matches_in_process(
+    run_linter: Callable[..., tuple[int, Any]], custom_plugin_dir: Path
 ) -> None:
-    """Test that --no-deps disables import errors."""
-    # First test without --no-deps to ensure it fails
-    exit_code, _ = run_linter(
-        str(bad_import_dir), output_format="json", message_level=MessageLevel.ERROR
+    """Test that the pylint subprocess the CLI starts reports what the tests see in-process."""
+    expected_exit_code, expected_results = run_linter(
+        str(custom_plugin_dir), output_format="python"
     )
 
-    # Should fail with import error
-    assert exit_code != 0, "Expected failure without --no-deps"
-
-    # Now test with --no-deps to ensure it passes
-    exit_code, _ = run_linter(
-        str(bad_import_dir),
-        output_format="json",
-        message_level=MessageLevel.ERROR,
-        no_deps=True,
+    exit_code, output = run_pylint(
+        str(custom_plugin_dir), output_format="json", use_cache=False
     )
 
-    # Should pass when import errors are ignored
-    assert exit_code == 0, "Expected success with --no-deps"
+    assert exit_code == expected_exit_code
+    assert json.loads(output) == expected_results
@@ -0,0 +1,135 @@
+"""Tests for dependency installation helpers."""
+
+import os
+import subprocess
+
+from soar_app_linter import dependency_utils
+from soar_app_linter.dependency_utils import (
+    _compute_dependency_state,
+    _is_empty_or_irrelevant,
+    _read_project_version,
+    _update_pylintrc,
+    _versions_match,
+)
+
+
+def test_missing_requirements_file_is_empty(tmp_path):
+    """Test that a missing requirements file is treated as empty."""
+    assert _is_empty_or_irrelevant(tmp_path / "requirements.txt") is True
+
+
+def test_comment_only_requirements_file_is_empty(dependency_files_dir):
+    """Test that a requirements file with only comments is treated as empty."""
+    req_file = dependency_files_dir / "requirements-comments-only.txt"
+    assert _is_empty_or_irrelevant(req_file) is True
+
+
+def test_edited_requirements_file_is_rechecked(tmp_path):
+    """Test that editing a requirements file invalidates the cached result."""
+    req_file = tmp_path / "requirements.txt"
+    req_file.write_text("# nothing yet\n")
+    assert _is_empty_or_irrelevant(req_file) is True
+
+    req_file.write_text("# nothing yet\nsix==1.16.0\n")
+    # Bump the mtime explicitly in case the filesystem timestamp resolution is coarse
+    stat_result = req_file.stat()
+    os.utime(req_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1))
+    assert _is_empty_or_irrelevant(req_file) is False
+
+
+def test_read_project_version(dependency_files_dir):
+    """Test reading the [project] version from a pyproject.toml."""
+    pyproject = dependency_files_dir / "pyproject.toml"
+    assert _read_project_version(pyproject) == "1.0.0-beta.1"
+    assert _read_project_version(dependency_files_dir / "missing.toml") is None
+
+
+def test_versions_match_normalizes_prereleases():
+    """Test that installed (normalized) and declared versions compare equal."""
+    assert _versions_match("1.0.0b1", "1.0.0-beta.1") is True
+    assert _versions_match("1.0.0", "1.0.0-beta.1") is False
+
+
+def test_update_pylintrc_creates_file(tmp_path):
+    """Test that a missing .pylintrc is created with .venv ignored."""
+    _update_pylintrc(tmp_path)
+    assert (tmp_path / ".pylintrc").read_text() == "[MASTER]\nignore = .venv\n\n"
+
+
+def test_update_pylintrc_extends_existing_ignore(tmp_path):
+    """Test that .venv is appended to an existing ignore list without touching other sections."""
+    pylintrc = tmp_path / ".pylintrc"
+    pylintrc.write_text(
+        "[MAIN]\n# generated files\nignore=build, dist\n\n[FORMAT]\nmax-line-length=120\n"
+    )
+    _update_pylintrc(tmp_path)
+    assert pylintrc.read_text() == (
+        "[MAIN]\n# generated files\nignore=build, dist, .venv\n\n[FORMAT]\nmax-line-length=120\n"
+    )
+
+
+def test_update_pylintrc_adds_main_section(tmp_path):
+    """Test that a main section is added to a .pylintrc without one, keeping its content."""
+    pylintrc = tmp_path / ".pylintrc"
+    pylintrc.write_text("# no sections yet\nignore=build\n")
+    _update_pylintrc(tmp_path)
+    assert pylintrc.read_text() == (
+        "# no sections yet\nignore=build\n\n[MASTER]\nignore = .venv\n"
+    )
+
+
+def test_update_pylintrc_leaves_file_alone_when_already_ignored(tmp_path):
+    """Test that .pylintrc is not rewritten when .venv is already ignored."""
+    pylintrc = tmp_path / ".pylintrc"
+    original = "[MASTER]\n# keep me\nignore=.venv\n"
+    pylintrc.write_text(original)
+    _update_pylintrc(tmp_path)
+    assert pylintrc.read_text() == original
+
+
+def test_dependency_state_changes_with_requirements(tmp_path):
+    """Test that editing requirements changes the recorded dependency state."""
+    req_file = tmp_path / "requirements.txt"
+    req_file.write_text("six==1.16.0\n")
+    before = _compute_dependency_state(tmp_path)
+    assert _compute_dependency_state(tmp_path) == before
+
+    req_file.write_text("six==1.17.0\n")
+    assert _compute_dependency_state(tmp_path) != before
+
+
+def test_install_dependencies_skips_unchanged_venv(tmp_path, monkeypatch):
+    """Test that install_dependencies is a no-op when the venv state matches its inputs."""
+    (tmp_path / "requirements.txt").write_text("six==1.16.0\n")
+    venv_bin = tmp_path / ".venv" / "bin"
+    venv_bin.mkdir(parents=True)
+    (venv_bin / "python").touch()
+    dependency_utils._write_venv_state(
+        tmp_path / ".venv", _compute_dependency_state(tmp_path)
+    )
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("venv setup should have been skipped")
+
+    monkeypatch.setattr(dependency_utils, "_ensure_venv_exists", _fail)
+    assert dependency_utils.install_dependencies(str(tmp_path)) is True
+    # a .pylintrc created since the last install still gets the venv ignored
+    assert "ignore = .venv" in (tmp_path / ".pylintrc").read_text()
+
+
+def test_sdist_only_dependency_is_reported_after_batch_install(tmp_path, monkeypatch):
+    """Test that a package without wheels is reported even if the batch install built it."""
+    req_file = tmp_path / "requirements.txt"
+    req_file.write_text("six==1.16.0\nsdistonly==1.0\n")
+    batch_cmd = ["uv", "pip", "install", "-r", "requirements.txt"]
+
+    def _fake_run(cmd, **kwargs):
+        # the plain batch builds sdists, wheel-only installs fail for sdistonly
+        failed = "--only-binary=:all:" in cmd and "sdistonly" in cmd
+        return subprocess.CompletedProcess(cmd, int(failed), "", "")
+
+    monkeypatch.setattr(subprocess, "run", _fake_run)
+    assert dependency_utils._install_and_verify_dependencies(
+        req_file, batch_cmd, tmp_path / "python", tmp_path, tmp_path / ".venv"
+    )
+    assert dependency_utils.LAST_UNINSTALLED_DEPS == ["sdistonly"]